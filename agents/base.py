@@ -1,12 +1,12 @@
 """Abstract base class for all agents."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from intelligentAgent.llm.client import LLMClient
 from intelligentAgent.llm.models import LLMResponse
 from intelligentAgent.tools.base import BaseTool
 from intelligentAgent.tools.registry import ToolRegistry
-from intelligentAgent.config import AgentConfig
+from intelligentAgent.config import AgentConfig, get_config
 from intelligentAgent.schemas.messages import Message
 from intelligentAgent.schemas.responses import AgentResponse
 
@@ -43,13 +43,17 @@ class BaseAgent(ABC):
         """
         self._llm_client = llm_client
         self._tool_registry = ToolRegistry()
-        self._config = config or AgentConfig()
+        self._config = config or get_config()
         self._messages: List[Message] = []
         
         # Register tools if provided
         if tools:
             for tool in tools:
                 self._tool_registry.register(tool)
+
+        # Tools don't change during a run, so build the OpenAI schema list once
+        # (invalidated by register_tool if the registry is mutated later)
+        self._tools_schema = self._tool_registry.get_openai_schemas()
     
     def run(self, query: str) -> AgentResponse:
         """Execute the agent's main loop.
@@ -97,13 +101,24 @@ class BaseAgent(ABC):
         message = Message(role=role, content=content, **kwargs)
         self._messages.append(message)
     
+    def register_tool(self, tool: BaseTool) -> None:
+        """Register an additional tool and refresh the cached schema list.
+
+        Args:
+            tool: Tool instance to register
+        """
+        self._tool_registry.register(tool)
+        self._tools_schema = self._tool_registry.get_openai_schemas()
+
     def _get_tools_schema(self) -> List[dict]:
         """Get all registered tools in OpenAI format.
-        
+
+        Cached at registration time since it's called on every LLM request.
+
         Returns:
             List of tool schemas
         """
-        return self._tool_registry.get_openai_schemas()
+        return self._tools_schema
     
     def _reset(self) -> None:
         """Reset conversation state for new query.
@@ -112,13 +127,17 @@ class BaseAgent(ABC):
         """
         self._messages = []
     
-    def get_conversation_history(self) -> List[Message]:
+    def get_conversation_history(self) -> Sequence[Message]:
         """Get current conversation history.
-        
+
+        Returns the live message sequence without copying; treat it as
+        read-only. Callers that need an independent snapshot should wrap it
+        in list()/tuple() themselves.
+
         Returns:
-            List of messages in the conversation
+            Read-only view of the messages in the conversation
         """
-        return self._messages.copy()
+        return self._messages
     
     @property
     def available_tools(self) -> List[str]:
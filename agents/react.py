@@ -1,5 +1,12 @@
 """ReAct agent implementation with chain of thought reasoning."""
 
+import asyncio
+import functools
+import inspect
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import List
 from intelligentAgent.agents.base import BaseAgent
 from intelligentAgent.agents.summarizer import SummarizerAgent
@@ -7,11 +14,18 @@ from intelligentAgent.llm.client import LLMClient
 from intelligentAgent.llm.models import LLMResponse
 from intelligentAgent.tools.base import BaseTool
 from intelligentAgent.schemas.messages import Message, ToolCall, ReActLoop
-from intelligentAgent.schemas.responses import AgentResponse, ToolResult
+from intelligentAgent.schemas.responses import AgentResponse, ToolResult, TraceEvent
 from intelligentAgent.prompts.react import REACT_SYSTEM_PROMPT
 from intelligentAgent.config import AgentConfig
 
 
+logger = logging.getLogger(__name__)
+
+# Built once at import time and shared by every agent instance; the system
+# prompt is static so there's no need to re-validate a Message per agent
+_REACT_SYSTEM_MESSAGE = Message(role="system", content=REACT_SYSTEM_PROMPT)
+
+
 class MaxIterationsError(Exception):
     """Raised when agent exceeds maximum iterations."""
     pass
@@ -19,14 +33,20 @@ class MaxIterationsError(Exception):
 
 class ReActAgent(BaseAgent):
     """ReAct agent that interleaves reasoning (thinking) and acting (using tools).
-    
+
     The ReAct pattern:
     1. Think: Reason about what to do next
     2. Act: Execute tools to gather information
     3. Observe: Process tool results
     4. Repeat until task is complete
     """
-    
+
+    # Static hint injected before each reasoning call; built once, reused forever
+    _REASONING_HINT = Message(
+        role="user",
+        content="Think step-by-step: What information do you have? What do you still need? List ALL tool calls whose inputs are already known and can be executed independently this turn."
+    )
+
     def __init__(
         self,
         llm_client: LLMClient,
@@ -49,27 +69,82 @@ class ReActAgent(BaseAgent):
         self._verbose = verbose
         self._loops: List[ReActLoop] = []
         self._loop_counter = 0  # Track total loop iterations across conversation
+        self._loops_compacted = 0  # Loops already replaced by summaries/truncations
         self._current_context_length = 0
         
         # Compaction thresholds from config
         self._compact_after_loops = config.compact_after_loops if config else 3
         self._compact_context_threshold = config.compact_context_threshold if config else 50000
-        
-        self._add_message("system", self._format_system_prompt())
-        self._summarizer = SummarizerAgent(llm_client, config=config, verbose=verbose)
-    
+
+        # Concurrency controls for parallel tool execution. The semaphore
+        # is rebuilt per arun(): run() starts a fresh event loop per query,
+        # and an asyncio.Semaphore binds to the loop that first awaits it,
+        # so a shared one breaks the next query's loop.
+        self._parallel_tools = config.parallel_tool_execution if config else True
+        self._max_parallel_tools = config.max_parallel_tools if config else 5
+        self._tool_semaphore: asyncio.Semaphore = None
+        # Dedicated bounded pool for sync tools so they don't fight other
+        # run_in_executor users for the loop's default executor
+        self._tool_pool = ThreadPoolExecutor(max_workers=self._max_parallel_tools, thread_name_prefix="tool")
+
+        # Speculative decide: start the action decision while reasoning still streams
+        self._speculative_decide = config.speculative_decide if config else False
+
+        # Bound on retained reasoning-trace events per run
+        self._max_trace_events = config.max_trace_events if config else 256
+
+        # Pending plan: tools the last reasoning mentioned but hasn't executed yet;
+        # lets us skip redundant reasoning round-trips when enabled
+        self._skip_reason_if_pending = config.skip_reason_if_pending_plan if config else False
+        self._pending_plan: set = set()
+
+        # Shared prebuilt system message; no loop exists yet so a direct
+        # append matches what _add_message would have done
+        self._messages.append(_REACT_SYSTEM_MESSAGE)
+
+    @cached_property
+    def _summarizer(self) -> SummarizerAgent:
+        """Summarizer agent, built on first compaction.
+
+        Short-lived agents whose queries never hit the compaction thresholds
+        skip its construction cost entirely.
+
+        Returns:
+            Lazily constructed SummarizerAgent
+        """
+        return SummarizerAgent(self._llm_client, config=self._config, verbose=self._verbose)
+
     def run(self, query: str) -> AgentResponse:
+        """Synchronous entry point for the ReAct loop.
+
+        Thin wrapper around arun() for callers without an event loop.
+
+        Args:
+            query: User's input query
+
+        Returns:
+            Structured agent response with answer and reasoning trace
+
+        Raises:
+            MaxIterationsError: If agent doesn't complete within max_iterations
+        """
+        return asyncio.run(self.arun(query))
+
+    async def arun(self, query: str) -> AgentResponse:
         """Execute the ReAct loop: Reason -> Act -> Observe -> Repeat.
-        
+
+        Independent tool calls within a single turn are dispatched concurrently,
+        so a turn's latency is bounded by its slowest tool rather than the sum.
+
         Args:
             query: User's input query
-            
+
         Returns:
             Structured agent response with answer and reasoning trace
-            
+
         Raises:
             MaxIterationsError: If agent doesn't complete within max_iterations
-        """        
+        """
         # Initialize a new ReAct loop and add to history
         new_loop = ReActLoop(iteration=self._loop_counter)
         self._loops.append(new_loop)
@@ -77,77 +152,126 @@ class ReActAgent(BaseAgent):
         # Add user query (automatically adds to both global messages and current loop)
         self._add_message("user", query)
         
-        # Track execution
-        reasoning_trace = []
-        tools_used = []
+        # Track execution: structured trace events in a bounded ring buffer
+        # (formatted lazily on return); tools_used doubles as an
+        # insertion-ordered set
+        reasoning_trace = deque(maxlen=self._max_trace_events)
+        tools_used: dict = {}
+        self._pending_plan = set()  # Fresh query, no carried-over plan
+        # Fresh semaphore bound to this run's event loop (see __init__)
+        self._tool_semaphore = asyncio.Semaphore(self._max_parallel_tools)
         
         # ReAct loop
         for iteration in range(self._max_iterations):            
-            if self._verbose:
-                print(f"\n--- Iteration {iteration + 1} ---")
+            logger.debug("--- Iteration %d ---", iteration + 1)
             
             # Step 1: REASON - Think about what to do next (no tools)
-            # Receives full conversation from all loops
-            reasoning_response = self._reason()
-            reasoning_text = reasoning_response.content or ""
-            self._current_context_length = reasoning_response.context_length
-            
-            if self._verbose:
-                print(f"____{reasoning_text}")
-            
-            # Track the reasoning
-            reasoning_trace.append(f"Thought: {reasoning_text}")
-            
-            # Add reasoning to conversation history
-            self._add_message("assistant", reasoning_text)
-            
+            # Receives full conversation from all loops. Skipped when the
+            # previous reasoning already planned tools that executed cleanly
+            # but haven't all run yet.
+            speculative_action = None
+            skip_reason = (
+                self._skip_reason_if_pending and
+                iteration > 0 and
+                bool(self._pending_plan)
+            )
+
+            if skip_reason:
+                logger.debug("Skipping reason: pending plan %s", sorted(self._pending_plan))
+            else:
+                if self._speculative_decide:
+                    reasoning_response, speculative_action = await self._reason_streaming()
+                else:
+                    reasoning_response = await self._reason()
+                reasoning_text = reasoning_response.content or ""
+                self._current_context_length = reasoning_response.context_length
+
+                logger.debug("Thought: %s", reasoning_text)
+
+                # Track the reasoning
+                reasoning_trace.append(TraceEvent("thought", reasoning_text))
+
+                # Add reasoning to conversation history
+                self._add_message("assistant", reasoning_text)
+
+                # Remember which tools this reasoning planned to use
+                self._pending_plan = {
+                    name for name in self.available_tools if name in reasoning_text
+                }
+
             # Step 2: ACT - Decide whether to use tools or provide final answer
-            action_response = self._decide_action()
+            # (reuse the speculative decision if one was confirmed during streaming)
+            action_response = speculative_action or await self._decide_action()
             
             if action_response.has_tool_calls:
-                # Execute requested tools
-                if self._verbose:
-                    print(f"__________Tools requested: {[tc.name + ' with arguments: ' + str(tc.arguments) for tc in action_response.tool_calls]}")
+                # Execute requested tools (lazy %s formatting: the arg list is
+                # only rendered when debug logging is actually enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Tools requested: %s",
+                        [(tc.name, tc.arguments) for tc in action_response.tool_calls]
+                    )
                 
-                results = self._act(action_response.tool_calls)
-                tools_used.extend([tc.name for tc in action_response.tool_calls])
+                results = await self._act(action_response.tool_calls)
+
+                # Extract call names once; reused for dedup, plan retirement and trace
+                tool_names = [tc.name for tc in action_response.tool_calls]
+                tools_used.update((name, None) for name in tool_names)
+
+                # Retire executed tools from the pending plan; drop the plan
+                # entirely if anything failed, forcing a fresh reasoning pass
+                if any(r.content.startswith("Error executing tool") for r in results):
+                    self._pending_plan = set()
+                else:
+                    self._pending_plan -= set(tool_names)
                 
                 # Step 3: OBSERVE - Add results to conversation
                 self._observe(action_response.tool_calls, results)
-                
+
                 # Track tool usage
-                tool_names = [tc.name for tc in action_response.tool_calls]
-                reasoning_trace.append(f"Action: Used tools {', '.join(tool_names)}")
+                reasoning_trace.append(TraceEvent("action", f"Used tools {', '.join(tool_names)}"))
                 
-                if self._verbose:
-                    for result in results:
-                        print(f"Observation: {result.content[:100]}...")
+                for result in results:
+                    logger.debug("Observation: %.100s...", result.content)
                 
                 # Add observation summary to continue reasoning
                 observation_summary = self._format_observations(results)
-                reasoning_trace.append(f"Observation: {observation_summary}")
+                reasoning_trace.append(TraceEvent("observation", observation_summary))
             
             else:
                 # No more tool calls - agent has final answer
                 self._loop_counter += 1  # Increment global loop counter
-                if self._verbose:
-                    print(f"__________Loop counter: {self._loop_counter}, current context length: {self._current_context_length}")
+                logger.debug(
+                    "Loop counter: %d, current context length: %d",
+                    self._loop_counter, self._current_context_length
+                )
                 
-                # Check if conversation compaction is needed based on thresholds
+                # Check if conversation compaction is needed based on
+                # thresholds. The provider-reported context length only
+                # refreshes when a reasoning call runs, so it goes stale on
+                # skipped-reasoning turns; the local chars/4 estimate
+                # (TokenCounter, microseconds per check) keeps the token
+                # gate honest in between.
+                context_tokens = max(
+                    self._current_context_length,
+                    sum(loop.estimated_tokens() for loop in self._loops)
+                )
                 should_compact = (
                     self._loop_counter >= self._compact_after_loops or
-                    self._current_context_length >= self._compact_context_threshold
+                    context_tokens >= self._compact_context_threshold
                 )
                 
                 if should_compact:
-                    if self._verbose:
-                        print(f"[Compaction triggered: loop_counter={self._loop_counter}, context_length={self._current_context_length}]")
-                    self._compact_conversation()
+                    logger.debug(
+                        "Compaction triggered: loop_counter=%d, context_tokens=%d",
+                        self._loop_counter, context_tokens
+                    )
+                    await self._compact_conversation()
                 
                 return AgentResponse(
                     answer=action_response.content or "No answer provided",
-                    reasoning_trace=reasoning_trace,
-                    tools_used=list(set(tools_used)),  # Unique tools
+                    reasoning_trace=[event.format() for event in reasoning_trace],
+                    tools_used=list(tools_used),  # Unique tools, first-use order
                     iterations=iteration + 1
                 )
         
@@ -157,10 +281,35 @@ class ReActAgent(BaseAgent):
             f"Consider increasing max_iterations or simplifying the query."
         )
 
-    def _compact_conversation(self, loops_to_summarize: int = 1) -> None:
-        """Compact the conversation history, starting from the first loop"""
-        self._summarizer.compact_conversation(self._loops)
-        self._messages = self._build_full_conversation_from_loops()
+    async def _compact_conversation(self, loops_to_summarize: int = 1) -> None:
+        """Compact the conversation history, starting from the first loop.
+
+        Splices the summarized loops' messages over the originals in place
+        instead of rebuilding the whole conversation, so each compaction costs
+        O(compacted prefix) rather than O(total messages).
+        """
+        start = self._loops_compacted
+
+        old_span = sum(
+            loop.message_count()
+            for loop in self._loops[start:start + loops_to_summarize]
+        )
+
+        new_loops = await self._summarizer.acompact_conversation(
+            self._loops, start, loops_to_summarize
+        )
+        self._loops[start:start + loops_to_summarize] = new_loops
+        self._loops_compacted = start + len(new_loops)
+
+        # Offset skips the system message plus already-summarized loops
+        # (each shrunk to a couple of messages, so this prefix walk is cheap)
+        offset = 1 + sum(loop.message_count() for loop in self._loops[:start])
+
+        new_messages: List[Message] = []
+        for loop in new_loops:
+            new_messages.extend(loop.messages)
+
+        self._messages[offset:offset + old_span] = new_messages
     
     def _add_message(
         self,
@@ -169,19 +318,22 @@ class ReActAgent(BaseAgent):
         **kwargs
     ) -> None:
         """Override to add message to both global history and current loop.
-        
+
         Args:
             role: Message role (system, user, assistant, tool)
             content: Message content
             **kwargs: Additional message fields (tool_calls, tool_call_id, etc.)
         """
-        # Add to global message history (parent implementation)
-        super()._add_message(role, content, **kwargs)
-        
-        # Also add to current loop if one exists
+        # Build the Message once and share it between the global history and
+        # the current loop. Everything on this path is internally generated
+        # (our own strings, SDK-parsed ToolCalls), so model_construct skips
+        # pydantic validation entirely
+        message = Message.model_construct(role=role, content=content, **kwargs)
+        self._messages.append(message)
+
         current_loop = self._get_current_loop()
         if current_loop:
-            current_loop.add_message(role, content, **kwargs)
+            current_loop.append(message)
     
     def _get_current_loop(self) -> ReActLoop:
         """Get the current (most recent) ReAct loop.
@@ -226,7 +378,7 @@ class ReActAgent(BaseAgent):
         """
         return self._loop_counter
     
-    def _reason(self) -> LLMResponse:
+    async def _reason(self) -> LLMResponse:
         """Step 1: Reasoning phase - Think about what to do next (WITHOUT tools).
         
         This is the critical "Think" step in ReAct where the agent reasons
@@ -237,85 +389,180 @@ class ReActAgent(BaseAgent):
         Returns:
             LLM response with reasoning (no tool calls)
         """
-        # Add a prompt to encourage reasoning
-        reasoning_messages = self._messages + [
-            Message(
-                role="user",
-                content="Think step-by-step: What information do you have? What do you still need? What tool calls should call next and in what order?"
+        # Append the hint in place instead of copying the whole history;
+        # popped again in finally so it never leaks into the conversation
+        self._messages.append(self._REASONING_HINT)
+        try:
+            # Call LLM WITHOUT tools to get pure reasoning (use reasoning model)
+            return await self._llm_client.achat(
+                messages=self._messages,
+                tools=self._get_tools_schema(),
+                tool_choice='none',
+                reason=True  # Use reasoning model for deep thinking
             )
-        ]
-        
-        # Call LLM WITHOUT tools to get pure reasoning (use reasoning model)
-        return self._llm_client.chat(
-            messages=reasoning_messages,
-            tools=self._get_tools_schema(),
-            tool_choice='none',
-            reason=True  # Use reasoning model for deep thinking
-        )
+        finally:
+            self._messages.pop()
     
-    def _decide_action(self) -> LLMResponse:
+    async def _reason_streaming(self):
+        """Streaming variant of _reason that pipelines the action decision.
+
+        Streams the reasoning tokens and, as soon as a registered tool name
+        appears in the partial text, speculatively starts _decide_action with
+        the partial reasoning — hiding one LLM round-trip per iteration. The
+        speculative decision is only accepted if the finished reasoning
+        mentions the same set of tools it did at launch time; otherwise it is
+        cancelled and the caller falls back to a fresh _decide_action.
+
+        Returns:
+            Tuple of (reasoning response, confirmed action response or None)
+        """
+        tool_names = self.available_tools
+        decide_task = None
+        launch_mentions = None
+        partial_chunks = []
+
+        def on_delta(delta: str) -> None:
+            nonlocal decide_task, launch_mentions
+            partial_chunks.append(delta)
+            if decide_task is not None:
+                return
+            partial_text = "".join(partial_chunks)
+            mentions = {name for name in tool_names if name in partial_text}
+            if mentions:
+                launch_mentions = mentions
+                decide_task = asyncio.create_task(
+                    self._decide_action(reasoning_override=partial_text)
+                )
+
+        # Append the hint in place instead of copying the whole history
+        self._messages.append(self._REASONING_HINT)
+        try:
+            reasoning_response = await self._llm_client.achat_stream(
+                messages=self._messages,
+                on_delta=on_delta,
+                reason=True
+            )
+        finally:
+            self._messages.pop()
+
+        speculative_action = None
+        if decide_task is not None:
+            final_text = reasoning_response.content or ""
+            final_mentions = {name for name in tool_names if name in final_text}
+            if final_mentions == launch_mentions:
+                speculative_action = await decide_task
+            else:
+                # Reasoning diverged from the speculation - discard it
+                decide_task.cancel()
+                logger.debug(
+                    "Speculative decide discarded: %s -> %s",
+                    launch_mentions, final_mentions
+                )
+
+        return reasoning_response, speculative_action
+
+    async def _decide_action(self, reasoning_override: str = None) -> LLMResponse:
         """Step 2: Action phase - Decide whether to use tools or answer.
-        
+
         After reasoning, the agent decides whether to:
         - Use tools to gather more information
         - Provide a final answer if it has enough information
-        
+
         Only sends messages from the current ReAct loop (not full conversation history)
         since tool selection is based on the current thought/reasoning cycle.
         Uses the faster inference model since the reasoning is already done.
-        
+
+        Args:
+            reasoning_override: Optional reasoning text to append as the latest
+                assistant message, used when deciding speculatively before the
+                reasoning has been committed to the conversation history
+
         Returns:
             LLM response with optional tool calls or final answer
         """
         # Send only current ReAct loop messages for tool decision (use faster inference model)
         current_loop = self._get_current_loop()
-        return self._llm_client.chat(
-            messages=current_loop.get_messages(),
+        messages = current_loop.get_messages()
+        if reasoning_override is not None:
+            messages = messages + [Message(role="assistant", content=reasoning_override)]
+        return await self._llm_client.achat(
+            messages=messages,
             tools=self._get_tools_schema(),
-            tool_choice="auto"  # Let model decide when to use tools
+            tool_choice="auto",  # Let model decide when to use tools
+            parallel_tool_calls=True  # Allow batching independent calls in one turn
         )
     
-    def _act(self, tool_calls: List[ToolCall]) -> List[ToolResult]:
-        """Execute each tool call and return results.
-        
+    async def _act(self, tool_calls: List[ToolCall]) -> List[ToolResult]:
+        """Execute the tool calls and return results.
+
+        Independent tool calls are dispatched concurrently (bounded by the
+        max_parallel_tools semaphore), so total latency is the max of the
+        individual tool latencies instead of their sum. Results are returned
+        in the original call order for _observe.
+
         Args:
             tool_calls: List of tool calls from the LLM
-            
+
         Returns:
-            List of tool execution results
+            List of tool execution results, in the same order as tool_calls
         """
-        results = []
-        
-        for tool_call in tool_calls:
-            try:
+        if self._parallel_tools and len(tool_calls) > 1:
+            # Structured concurrency: tasks are bounded by the semaphore and
+            # _run_one converts failures into error ToolResults, so the group
+            # never propagates tool exceptions
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._run_one(tc)) for tc in tool_calls]
+            return [task.result() for task in tasks]
+
+        return [await self._run_one(tc) for tc in tool_calls]
+
+    async def _run_one(self, tool_call: ToolCall) -> ToolResult:
+        """Execute a single tool call, converting any failure into an error result.
+
+        Args:
+            tool_call: Tool call from the LLM
+
+        Returns:
+            Tool execution result (or error message for the LLM)
+        """
+        try:
+            # Acquire inside the try so even infrastructure failures (e.g.
+            # a semaphore bound to a dead loop) degrade to error ToolResults
+            # instead of escaping the TaskGroup and killing the whole query
+            async with self._tool_semaphore:
                 # Get tool from registry
                 tool = self._tool_registry.get(tool_call.name)
-                
+
                 # Validate arguments with Pydantic
                 validated_args = tool.args_schema.model_validate(tool_call.arguments)
-                
-                # Execute tool
-                result_content = tool.execute(**validated_args.model_dump())
-                
-                results.append(
-                    ToolResult(
-                        tool_call_id=tool_call.id,
-                        arguments=tool_call.arguments,
-                        content=result_content
-                    )
-                )
-            
-            except Exception as e:
-                # Return error message to LLM
-                results.append(
-                    ToolResult(
-                        tool_call_id=tool_call.id,
-                        arguments=tool_call.arguments,
-                        content=f"Error executing tool: {str(e)}"
+
+                # Execute tool: prefer a native async override, fall back to
+                # offloading sync execute() onto the agent's bounded pool.
+                # __dict__ hands over the already-validated field values
+                # without paying for a model_dump re-serialization.
+                args = validated_args.__dict__
+                if type(tool).aexecute is not BaseTool.aexecute:
+                    result_content = await tool.aexecute(**args)
+                elif inspect.iscoroutinefunction(tool.execute):
+                    result_content = await tool.execute(**args)
+                else:
+                    result_content = await asyncio.get_running_loop().run_in_executor(
+                        self._tool_pool, functools.partial(tool.execute, **args)
                     )
+
+                return ToolResult(
+                    tool_call_id=tool_call.id,
+                    arguments=tool_call.arguments,
+                    content=result_content
                 )
-        
-        return results
+
+        except Exception as e:
+            # Return error message to LLM
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                arguments=tool_call.arguments,
+                content=f"Error executing tool: {str(e)}"
+            )
     
     def _observe(self, tool_calls: List[ToolCall], results: List[ToolResult]) -> None:
         """Step 3: Observation phase - Add tool results to message history.
@@ -326,14 +573,25 @@ class ReActAgent(BaseAgent):
         """
         # Add assistant message with tool calls
         self._add_message("assistant", content=None, tool_calls=tool_calls)
-        
-        # Add tool result messages
-        for result in results:
-            self._add_message(
-                "tool",
+
+        # Batch-construct tool result messages. model_construct skips pydantic
+        # validation - safe because every field originates from our own code -
+        # and two extends replace N individual appends per history.
+        result_messages = [
+            Message.model_construct(
+                role="tool",
                 content=result.content + " (with arguments: " + str(result.arguments) + ")",
-                tool_call_id=result.tool_call_id
+                tool_calls=None,
+                tool_call_id=result.tool_call_id,
+                name=None
             )
+            for result in results
+        ]
+        self._messages.extend(result_messages)
+
+        current_loop = self._get_current_loop()
+        if current_loop:
+            current_loop.messages.extend(result_messages)
     
     def _format_observations(self, results: List[ToolResult]) -> str:
         """Format tool results into a readable observation summary.
@@ -344,13 +602,12 @@ class ReActAgent(BaseAgent):
         Returns:
             Formatted observation text
         """
-        observations = []
-        for result in results:
-            # Truncate long results for reasoning trace
-            content = result.content[:200] + "..." if len(result.content) > 200 else result.content
-            observations.append(content)
-        
-        return " | ".join(observations)
+        # Truncate long results for reasoning trace; single join, no
+        # intermediate list, and short contents aren't re-sliced
+        return " | ".join(
+            c if len(c) <= 200 else f"{c[:200]}..."
+            for c in (r.content for r in results)
+        )
     
     def _format_system_prompt(self) -> str:
         """Return the ReAct system prompt.
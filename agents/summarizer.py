@@ -1,12 +1,168 @@
 """Summarizer agent for condensing conversation histories."""
 
-from typing import List, Optional, Tuple
+import io
+
+import orjson
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from intelligentAgent.agents.base import BaseAgent
+from intelligentAgent.llm.cache import SummaryCache
 from intelligentAgent.llm.client import LLMClient
+from intelligentAgent.llm.models import LLMResponse
+from intelligentAgent.llm.ollama_client import OllamaClient
 from intelligentAgent.schemas import ReActLoop
 from intelligentAgent.schemas.messages import Message
-from intelligentAgent.prompts.summarizer import SUMMARIZER_SYSTEM_PROMPT
-from intelligentAgent.config import AgentConfig
+from intelligentAgent.prompts.summarizer import ANCHORED_SUMMARY_PROMPT
+from intelligentAgent.config import AgentConfig, get_config
+
+
+# Built once at import; the summarizer prompt is immutable, so every instance
+# can share the same validated Message
+_SUMMARIZER_SYSTEM_MSG = Message(role="system", content=ANCHORED_SUMMARY_PROMPT)
+
+# Fixed sections of the anchored running summary; the model must return a JSON
+# object with exactly these keys
+_SUMMARY_SECTIONS = ("intent", "actions", "facts", "tools", "next_steps")
+
+# Constrains summary completions to valid JSON
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Stable provider-side cache key: every summarization call shares the same
+# system-prompt prefix, so the provider can skip re-processing it
+_PROMPT_CACHE_KEY = "summarizer-anchored-v1"
+
+# Literal fragments for summary rendering, precomputed once so the hot
+# formatting loop is pure writes with no per-message f-string machinery
+_USER_PREFIX = "USER: "
+_TOOL_PREFIX = "TOOL RESULT: "
+_ASSISTANT_PREFIX = "ASSISTANT: "
+_TOOLCALL_PREFIX = "ASSISTANT: [Called tools: "
+_TOOLCALL_SUFFIX = "]\n"
+
+# Simple per-role prefixes; assistant is handled inline in the loop since it
+# also does tool-call bookkeeping
+_ROLE_PREFIXES = {
+    "user": _USER_PREFIX,
+    "tool": _TOOL_PREFIX,
+}
+
+# Marker inserted where truncated tool-result content was elided
+_ELISION = "\n... [truncated] ...\n"
+
+# Process-wide summary cache, shared across agent instances like the tools'
+# response caches. Keys cover BOTH merge inputs — the running summary and
+# the loop text — because the cached value is the merge output: a text-only
+# key would replay whatever anchor state existed when the entry was written
+# into unrelated conversations. Replayed conversations re-derive the same
+# anchor chain step by step, so full reruns still hit on every loop.
+_summary_cache = SummaryCache()
+
+
+@dataclass(slots=True, frozen=True)
+class FormattedLoop:
+    """Rendered conversation text of one loop plus the tools it used.
+
+    Slots keep the per-loop overhead to two references, and the frozen tools
+    tuple is cheaper to share and iterate than a throwaway list.
+    """
+
+    text: str
+    tools: Tuple[str, ...]
+
+
+class SlidingWindowStrategy:
+    """LLM-free compaction for loops far outside the recent window.
+
+    Loops close to the conversation tail are worth a real LLM summary, but
+    ancient loops are rarely referenced again — for those, dropping the middle
+    of bulky tool results (keeping a head/tail excerpt) preserves enough
+    context at zero LLM cost. User and assistant turns are kept verbatim so
+    conversation boundaries stay intact.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 3,
+        should_truncate_results: bool = True,
+        head_chars: int = 200,
+        tail_chars: int = 200
+    ):
+        """Initialize the strategy.
+
+        Args:
+            window_size: Loops within this distance of the newest loop still
+                get LLM summarization; older loops are truncated instead
+            should_truncate_results: If False, old loops pass through unchanged
+            head_chars: Characters kept from the start of a tool result
+            tail_chars: Characters kept from the end of a tool result
+        """
+        self.window_size = window_size
+        self.should_truncate_results = should_truncate_results
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+
+    def is_outside_window(self, loop_index: int, total_loops: int) -> bool:
+        """Check whether a loop is too old to deserve an LLM summary.
+
+        Args:
+            loop_index: Index of the loop in the conversation
+            total_loops: Total number of loops in the conversation
+
+        Returns:
+            True if the loop is older than the sliding window
+        """
+        return (total_loops - 1 - loop_index) > self.window_size
+
+    def truncate_loop(self, loop: ReActLoop) -> ReActLoop:
+        """Build a truncated copy of a loop without calling the LLM.
+
+        Args:
+            loop: ReActLoop to truncate
+
+        Returns:
+            ReActLoop with tool results shrunk to head/tail excerpts
+        """
+        if not self.should_truncate_results:
+            return loop
+        return ReActLoop(
+            messages=[self._truncate_message(msg) for msg in loop.get_messages()],
+            iteration=loop.iteration,
+            tools_used=list(loop.tools_used)
+        )
+
+    def _truncate_message(self, message: Message) -> Message:
+        """Truncate a single message if it is a bulky tool result.
+
+        Args:
+            message: Message to (possibly) truncate
+
+        Returns:
+            Original message, or a copy with shortened content
+        """
+        if message.role != "tool" or not message.content:
+            return message
+        truncated = self._truncate_text(message.content)
+        if truncated is message.content:
+            return message
+        return Message(
+            role="tool",
+            content=truncated,
+            tool_call_id=message.tool_call_id,
+            name=message.name
+        )
+
+    def _truncate_text(self, text: str) -> str:
+        """Keep the head and tail of a long text, eliding the middle.
+
+        Args:
+            text: Text to truncate
+
+        Returns:
+            Truncated text, or the original if already short enough
+        """
+        if len(text) <= self.head_chars + self.tail_chars + len(_ELISION):
+            return text
+        return text[:self.head_chars] + _ELISION + text[-self.tail_chars:]
 
 
 class SummarizerAgent(BaseAgent):
@@ -37,30 +193,180 @@ class SummarizerAgent(BaseAgent):
             config: Optional agent configuration
             verbose: Enable verbose output for debugging
         """
+        config = config or get_config()
+
+        # Summarization is a non-reasoning task; route it to a local Ollama
+        # server when configured (same OpenAI wire protocol, different host)
+        if config.summary_backend == "ollama":
+            llm_client = OllamaClient(config)
+
         # No tools needed for summarization
         super().__init__(llm_client, tools=None, config=config)
         self._verbose = verbose
         self._tools_used = []
-        self._loop_summerized = 0
-        self._system_prompt_msg = Message(role="system", content=self._format_system_prompt())
+        self._system_prompt_msg = _SUMMARIZER_SYSTEM_MSG
+
+        # Anchored running summary: one structured object merged with each
+        # newly compacted loop, so every summarization prompt costs
+        # O(summary + one loop) instead of O(all history so far)
+        self._running_summary: Dict[str, str] = {
+            section: "" for section in _SUMMARY_SECTIONS
+        }
+
+        # Optional verbatim-first compaction: loops that fit the budget
+        # after dropping low-signal messages whole skip the LLM entirely
+        # and keep their surviving numbers and tool outputs exact
+        self._verbatim_budget = self._config.verbatim_compaction_budget
+
+        # Ancient loops (outside the window) are truncated for free instead
+        # of paying an LLM round-trip per compaction
+        self._window = SlidingWindowStrategy(
+            window_size=self._config.summary_window_size,
+            should_truncate_results=self._config.truncate_old_tool_results
+        )
     
-    def compact_conversation(self, loops: List[ReActLoop], loops_to_summarize: int = 1):
-        """Compact conversation by summarizing specified number of loops.
-        
-        from conversation beginning, Modifies the loops list in place by replacing loops with their summarized versions.
-        
+    def compact_conversation(self, loops: List[ReActLoop], start: int, count: int = 1) -> List[ReActLoop]:
+        """Compact a contiguous range of loops and return the replacements.
+
+        Does not mutate the loops list — the caller splices the result back
+        in (``loops[start:start+count] = ...``). Keeping position out of
+        agent state makes the summarizer reentrant, so disjoint ranges can
+        be compacted concurrently.
+
+        Loops far outside the recent window are truncated via the sliding
+        window strategy (no LLM call). Windowed loops first try verbatim
+        compaction when a budget is configured; only loops that still don't
+        fit pay for an LLM summary.
+
         Args:
-            loops: List of ReActLoop objects to summarize (modified in place)
-            loops_to_summarize: Number of loops to summarize from last summarized
-            
+            loops: Full list of conversation loops (read, not modified)
+            start: Index of the first loop to compact
+            count: Number of loops to compact
+
         Returns:
-            None (modifies loops in place)
+            Replacement loops for loops[start:start + count]
         """
-        for i in range(loops_to_summarize):
-            summerized_loop = self.summarize_loop(loops[self._loop_summerized])
-            loops[self._loop_summerized] = summerized_loop
-            self._loop_summerized += 1
-    
+        total = len(loops)
+        return [
+            self._window.truncate_loop(loops[i])
+            if self._window.is_outside_window(i, total)
+            else (self._compact_verbatim(loops[i]) or self.summarize_loop(loops[i]))
+            for i in range(start, min(start + count, total))
+        ]
+
+    async def acompact_conversation(self, loops: List[ReActLoop], start: int, count: int = 1) -> List[ReActLoop]:
+        """Async compaction suitable for use inside the agent's event loop.
+
+        Ancient loops (outside the sliding window) are truncated for free,
+        and windowed loops first try verbatim compaction when a budget is
+        configured. The remaining loops are merged into the anchored running
+        summary one at a time — each merge consumes the previous merge's
+        output, so those requests are inherently sequential. Like
+        compact_conversation, the loops list itself is left untouched for
+        the caller to splice.
+
+        Args:
+            loops: Full list of conversation loops (read, not modified)
+            start: Index of the first loop to compact
+            count: Number of loops to compact
+
+        Returns:
+            Replacement loops for loops[start:start + count]
+        """
+        total = len(loops)
+        end = min(start + count, total)
+
+        if self._verbose and end > start:
+            print(f"_____________________ Compacting {end - start} loops from loop-{start} _____________________")
+
+        replacements = []
+        for i in range(start, end):
+            if self._window.is_outside_window(i, total):
+                replacements.append(self._window.truncate_loop(loops[i]))
+            else:
+                replacements.append(
+                    self._compact_verbatim(loops[i])
+                    or await self.asummarize_loop(loops[i])
+                )
+        return replacements
+
+    def _compact_verbatim(self, loop: ReActLoop) -> Optional[ReActLoop]:
+        """Try the LLM-free verbatim compaction pass on a windowed loop.
+
+        Works on a copy so the caller's loop stays intact for the summarizer
+        fallback when dropping whole messages can't reach the budget (system
+        and user messages are never dropped, so small budgets may not fit).
+
+        Args:
+            loop: ReActLoop to compact
+
+        Returns:
+            Compacted replacement loop, or None if verbatim compaction is
+            disabled or couldn't bring the loop under budget
+        """
+        if not self._verbatim_budget:
+            return None
+
+        candidate = ReActLoop(
+            messages=list(loop.get_messages()),
+            iteration=loop.iteration,
+            tools_used=list(loop.tools_used)
+        )
+        candidate.compact_verbatim(self._verbatim_budget)
+        if candidate.estimated_tokens() > self._verbatim_budget:
+            return None
+
+        if self._verbose:
+            print(f"_____________________ Verbatim-compacted loop-{loop.iteration} _____________________")
+        return candidate
+
+    async def asummarize_loop(
+        self,
+        loop: ReActLoop,
+    ) -> ReActLoop:
+        """Async variant of summarize_loop for use inside an event loop.
+
+        Awaitable summarizations let independent agents (or an agent and its
+        compaction) share the event loop and overlap network latency via
+        asyncio.gather instead of blocking a thread per call; concurrency is
+        bounded by the LLM client's request semaphore.
+
+        Args:
+            loop: ReActLoop object to summarize
+
+        Returns:
+            ReActLoop: New loop with user message and summary, preserving tools used
+        """
+        request_msg, tools_used, user_msg = self._build_summary_request(loop)
+
+        # Identical (running summary, loop) merge inputs resolve from the
+        # cache; the request content embeds both, so a hit can never carry
+        # another anchor state's merge
+        cache_key = SummaryCache.key_for(request_msg.content)
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            return self._finish_summary(
+                user_msg, request_msg, tools_used,
+                LLMResponse(content=cached, finish_reason="stop"),
+                loop.iteration
+            )
+
+        if self._verbose:
+            print(f"_____________________ Summarizing loop-{loop.iteration} _____________________")
+
+        response = await self._llm_client.achat(
+            messages=[self._system_prompt_msg, request_msg],
+            tools=None,  # No tools for summarization
+            model=self._llm_client.summary_model,
+            response_format=_JSON_RESPONSE_FORMAT,
+            prompt_cache_key=_PROMPT_CACHE_KEY
+        )
+
+        if response.content:
+            _summary_cache.put(cache_key, response.content)
+
+        return self._finish_summary(user_msg, request_msg, tools_used, response, loop.iteration)
+
     def summarize_loop(
         self,
         loop: ReActLoop,
@@ -75,89 +381,195 @@ class SummarizerAgent(BaseAgent):
             
         Returns:
             ReActLoop: New loop with user message and summary, preserving tools used
-        """        
-        
-        # Format the loop history for summarization
-        conversation_text, tools_used = self._format_messages_for_summary(loop.get_messages())
-        
-        # Create the summarization request
-        messages = [
-            self._system_prompt_msg,
-            Message(role="user", content=f"Please summarize the following conversation history:\n\n{conversation_text}")
-        ]
-        
+        """
+
+        request_msg, tools_used, user_msg = self._build_summary_request(loop)
+
+        # Identical (running summary, loop) merge inputs resolve from the
+        # cache; the request content embeds both, so a hit can never carry
+        # another anchor state's merge
+        cache_key = SummaryCache.key_for(request_msg.content)
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            return self._finish_summary(
+                user_msg, request_msg, tools_used,
+                LLMResponse(content=cached, finish_reason="stop"),
+                loop.iteration
+            )
+
         if self._verbose:
-            print(f"_____________________ Summarizing {len(messages)} messages... in loop-{self._loop_summerized} _____________________")
-        
-        # Get summary from LLM (use summary model from config)
-        response = self._llm_client.chat(
-            messages=messages,
-            tools=None,  # No tools for summarization
+            print(f"_____________________ Summarizing loop-{loop.iteration} _____________________")
+
+        # Stream the merge (pinned to the summary model): tokens surface as
+        # they arrive instead of blocking on the full generation, though the
+        # structured merge itself still needs the complete JSON
+        chunks = []
+        for token in self._llm_client.chat_stream_text(
+            messages=[self._system_prompt_msg, request_msg],
+            model=self._llm_client.summary_model,
+            response_format=_JSON_RESPONSE_FORMAT,
+            prompt_cache_key=_PROMPT_CACHE_KEY
+        ):
+            chunks.append(token)
+            if self._verbose:
+                print(token, end="", flush=True)
+        if self._verbose and chunks:
+            print()
+
+        response = LLMResponse(content="".join(chunks) or None, finish_reason="stop")
+
+        if response.content:
+            _summary_cache.put(cache_key, response.content)
+
+        return self._finish_summary(user_msg, request_msg, tools_used, response, loop.iteration)
+
+    def _build_summary_request(self, loop: ReActLoop) -> Tuple[Message, Tuple[str, ...], Message]:
+        """Format a loop into its anchored merge request message.
+
+        The request carries only the current running summary plus the one new
+        loop, keeping input size flat regardless of conversation length.
+        Materializes the loop's messages once and hands the user message back
+        so callers never walk the loop a second time.
+
+        Args:
+            loop: ReActLoop to format
+
+        Returns:
+            Tuple of (merge request message,
+            tool names used during the loop,
+            the loop's opening user message)
+        """
+        messages = loop.get_messages()
+        formatted = self._format_messages_for_summary(messages)
+
+        request_msg = Message(
+            role="user",
+            content=(
+                f"Current structured summary:\n{orjson.dumps(self._running_summary).decode()}\n\n"
+                f"New conversation segment:\n\n{formatted.text}"
+            )
         )
-        
-        summary_text = response.content or "Summary generation failed."
-        
+        return request_msg, formatted.tools, messages[0]
+
+    def _finish_summary(
+        self,
+        user_msg: Message,
+        request_msg: Message,
+        tools_used: Tuple[str, ...],
+        response,
+        iteration: int
+    ) -> ReActLoop:
+        """Merge a summary response into the running summary and build the replacement loop.
+
+        Args:
+            user_msg: Opening user message of the summarized loop
+            request_msg: The merge request sent for this loop
+            tools_used: Tool names extracted from the loop
+            response: LLM response carrying the updated structured summary
+            iteration: Iteration number carried over from the original loop
+
+        Returns:
+            ReActLoop: New loop with user message and summary, preserving tools used
+        """
+        summary_text = self._merge_running_summary(response.content)
+
         if self._verbose:
-            print(f"Summary number of messages: {len(summary_text)} orginal number of messages: {len(conversation_text)}")
-        
-        # getting user query from the loop
-        user_msg = loop.get_messages()[0]
-        summerized_loop = ReActLoop(messages=[user_msg], iteration=self._loop_summerized, tools_used=tools_used)
-        summerized_loop.add_message("summary", content=summary_text)
+            print(f"Summary length: {len(summary_text)} original length: {len(request_msg.content)}")
+
+        summerized_loop = ReActLoop(messages=[user_msg], iteration=iteration, tools_used=tools_used)
+        summerized_loop.add_message_fast("summary", content=summary_text)
         return summerized_loop
-    
-    def _format_messages_for_summary(self, messages: List[Message]) -> Tuple[str, List[str]]:
+
+    def _merge_running_summary(self, content: Optional[str]) -> str:
+        """Fold a merge response into the running summary.
+
+        Args:
+            content: Raw response content, expected to be a JSON object with
+                the fixed summary sections
+
+        Returns:
+            Rendered running summary to place in the compacted loop, or the
+            raw content if it wasn't valid JSON
+        """
+        if not content:
+            return "Summary generation failed."
+
+        try:
+            parsed = orjson.loads(content)
+        except ValueError:
+            # Model ignored the JSON constraint; use the text as-is without
+            # corrupting the structured state
+            return content
+
+        if isinstance(parsed, dict):
+            for section in _SUMMARY_SECTIONS:
+                value = parsed.get(section)
+                if value is not None:
+                    self._running_summary[section] = (
+                        value if isinstance(value, str) else orjson.dumps(value).decode()
+                    )
+        return orjson.dumps(self._running_summary).decode()
+
+    def _format_messages_for_summary(self, messages: List[Message]) -> FormattedLoop:
         """Format conversation messages into readable text for summarization.
-        
+
         Also extracts tools used during the iteration to avoid double-pass.
-        
+
         Args:
             messages: List of messages to format
-            
+
         Returns:
-            Tuple[str, List[str]]: A tuple containing:
-                - Formatted conversation text as a string
-                - List of unique tool names used during the conversation
+            FormattedLoop holding the conversation text and the unique tool
+            names used during the conversation
         """
-        formatted_lines = []
+        buf = io.StringIO()
         tools_set = set()
-        
+
         for msg in messages:
-            if msg.role == "system":
-                # Skip system prompts - they're not part of the conversation
+            # Nothing to render and no tools to record; skip all branching
+            if not msg.content and not msg.tool_calls:
                 continue
-            
-            elif msg.role == "user":
-                formatted_lines.append(f"USER: {msg.content}")
-            
+
+            prefix = _ROLE_PREFIXES.get(msg.role)
+            if prefix is not None:
+                buf.write(prefix)
+                buf.write(str(msg.content))
+                buf.write("\n")
+
             elif msg.role == "assistant":
                 # Assistant messages can have content, tool_calls, or both
                 if msg.tool_calls:
-                    # Extract tool names
                     tool_names = [tc.name for tc in msg.tool_calls]
-                    for name in tool_names:
-                        tools_set.add(name)
-                
-                    # Format output
+                    tools_set.update(tool_names)
+
                     if msg.content:
                         # Both reasoning and tool calls
-                        formatted_lines.append(f"ASSISTANT: {msg.content}")
-                    formatted_lines.append(f"ASSISTANT: [Called tools: {', '.join(tool_names)}]")
+                        buf.write(_ASSISTANT_PREFIX)
+                        buf.write(msg.content)
+                        buf.write("\n")
+                    buf.write(_TOOLCALL_PREFIX)
+                    buf.write(", ".join(tool_names))
+                    buf.write(_TOOLCALL_SUFFIX)
                 elif msg.content:
                     # Only content (reasoning or final answer)
-                    formatted_lines.append(f"ASSISTANT: {msg.content}")
-            
-            elif msg.role == "tool":
-                # Tool result
-                formatted_lines.append(f"TOOL RESULT: {msg.content}")
-        
-        return "\n".join(formatted_lines), list(tools_set)
+                    buf.write(_ASSISTANT_PREFIX)
+                    buf.write(msg.content)
+                    buf.write("\n")
+
+            # System (and any other) roles aren't part of the conversation text
+
+        # Drop the trailing newline to match a "\n".join of the lines
+        text = buf.getvalue()
+        return FormattedLoop(
+            text=text[:-1] if text.endswith("\n") else text,
+            tools=tuple(tools_set)
+        )
     
     def _format_system_prompt(self) -> str:
         """Return the Summarizer system prompt.
-        
+
         Returns:
-            System prompt for summarization
+            System prompt for anchored summary merging
         """
-        return SUMMARIZER_SYSTEM_PROMPT
+        return ANCHORED_SUMMARY_PROMPT
 
@@ -1,6 +1,8 @@
 """Configuration management using pydantic-settings."""
 
+import functools
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -27,10 +29,67 @@ class AgentConfig(BaseSettings):
         default="gpt-4-nano",
         description="Model for simple inference tasks (faster, cheaper)"
     )
+    openai_summary_model: str = Field(
+        default="gpt-4-nano",
+        description="Model for conversation summarization/compaction (cheapest adequate)"
+    )
+
+    # Summarization Backend Configuration
+    summary_backend: Literal["openai", "ollama"] = Field(
+        default="openai",
+        description="Backend for summarization calls; 'ollama' targets a local server"
+    )
+    ollama_base_url: str = Field(
+        default="http://localhost:11434/v1",
+        description="Base URL of the local Ollama OpenAI-compatible endpoint"
+    )
+    ollama_summary_model: str = Field(
+        default="qwen2.5:14b",
+        description="Local model used for summarization when summary_backend is 'ollama'"
+    )
     
     # Agent Configuration
     max_iterations: int = Field(default=10, ge=1, description="Maximum iterations for agent loop")
     verbose: bool = Field(default=False, description="Enable verbose output")
+
+    max_trace_events: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum reasoning-trace events retained per run (oldest dropped first)"
+    )
+
+    # LLM Request Configuration
+    max_concurrent_requests: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of concurrent in-flight LLM requests (rate-limit guard)"
+    )
+
+    # Tool Execution Configuration
+    parallel_tool_execution: bool = Field(
+        default=True,
+        description="Execute independent tool calls from a single turn concurrently"
+    )
+    max_parallel_tools: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum number of tool calls executed concurrently"
+    )
+    skip_reason_if_pending_plan: bool = Field(
+        default=False,
+        description=(
+            "Skip the reasoning round-trip when the previous turn's reasoning "
+            "already planned tool calls that haven't executed yet, halving LLM "
+            "calls on multi-step traces"
+        )
+    )
+    speculative_decide: bool = Field(
+        default=False,
+        description=(
+            "Stream the reasoning step and speculatively start the action decision "
+            "as soon as a tool is mentioned, hiding one LLM round-trip per iteration"
+        )
+    )
     
     # Conversation Compaction Configuration
     compact_after_loops: int = Field(
@@ -44,8 +103,59 @@ class AgentConfig(BaseSettings):
         ge=1000,
         description="Context length (in tokens) after which to trigger compaction"
     )
-    
+
+    summary_window_size: int = Field(
+        default=3,
+        ge=0,
+        description=(
+            "Loops within this distance of the newest still get LLM "
+            "summarization during compaction; anything older is truncated "
+            "in place without an LLM call"
+        )
+    )
+    truncate_old_tool_results: bool = Field(
+        default=True,
+        description=(
+            "Shrink tool results of loops outside the summary window to "
+            "head/tail excerpts instead of paying for LLM summarization"
+        )
+    )
+    verbatim_compaction_budget: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "When > 0, compaction first tries dropping low-signal messages "
+            "verbatim until a loop fits this many tokens (chars/4 "
+            "heuristic), falling back to LLM summarization only for loops "
+            "that still don't fit. 0 disables the verbatim-first pass"
+        )
+    )
+
+    marketaux_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        description=(
+            "Seconds to reuse cached Marketaux API responses for identical "
+            "queries; matches the provider's minutes-scale data cadence. "
+            "0 disables caching"
+        )
+    )
+
     # API Keys
     alphavantage_api_key: str = Field(default='LQZ843E6GUXS9563', description="Alpha Vantage API key for stock data")
     marketaux_api_key: str = Field(defailt='CnnCfqBR021wPSKkMUc6ChxOUocZmbXfDYglCtmJ', description="Marketaux API key for financial news and market data")
 
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> AgentConfig:
+    """Get the process-wide shared AgentConfig.
+
+    Constructing AgentConfig re-reads the .env file and re-runs full pydantic
+    validation; caching makes every agent, client, and tool share one parsed
+    instance instead of paying that cost per construction.
+
+    Returns:
+        The shared AgentConfig instance
+    """
+    return AgentConfig()
+
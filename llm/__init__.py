@@ -1,7 +1,9 @@
 """LLM client and models."""
 
+from intelligentAgent.llm.cache import SummaryCache
 from intelligentAgent.llm.client import LLMClient
 from intelligentAgent.llm.models import LLMResponse
+from intelligentAgent.llm.ollama_client import OllamaClient
 
-__all__ = ["LLMClient", "LLMResponse"]
+__all__ = ["LLMClient", "LLMResponse", "OllamaClient", "SummaryCache"]
 
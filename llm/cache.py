@@ -0,0 +1,66 @@
+"""Content-addressed cache for conversation summaries."""
+
+import hashlib
+from typing import Dict, Optional
+
+
+class SummaryCache:
+    """Exact-match cache for loop summaries keyed by conversation content.
+
+    Repeated agent runs (dev loops, retries, deterministic replays) often
+    re-summarize byte-identical conversations; hashing the formatted text
+    turns those into dictionary lookups instead of LLM round-trips. Bounded
+    FIFO eviction keeps memory flat for long-lived processes.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum cached summaries before oldest are evicted
+        """
+        self._entries: Dict[str, str] = {}
+        self._max_entries = max_entries
+
+    @staticmethod
+    def key_for(text: str) -> str:
+        """Compute the stable content-addressed key for a conversation text.
+
+        Args:
+            text: Formatted conversation text to key on
+
+        Returns:
+            Hex SHA-256 digest of the text
+        """
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached summary.
+
+        Args:
+            key: Content key from key_for()
+
+        Returns:
+            Cached summary text, or None on miss
+        """
+        return self._entries.get(key)
+
+    def put(self, key: str, summary: str) -> None:
+        """Store a summary, evicting the oldest entry when full.
+
+        Args:
+            key: Content key from key_for()
+            summary: Summary text to cache
+        """
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            # dicts preserve insertion order, so the first key is the oldest
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = summary
+
+    def __len__(self) -> int:
+        """Get number of cached summaries."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a key is cached."""
+        return key in self._entries
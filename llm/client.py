@@ -1,14 +1,46 @@
 """LLM client wrapper. currently only OpenAI is supported"""
 
 from ast import Tuple
-import json
-from typing import List, Optional
-from openai import OpenAI
+import asyncio
+import weakref
+from typing import Iterator, List, Optional
+import orjson
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from intelligentAgent.config import AgentConfig
 from intelligentAgent.llm.models import LLMResponse
 from intelligentAgent.schemas.messages import Message
 
 
+# One persistent HTTP client per event loop, shared by every LLMClient on
+# that loop: connections stay warm across calls and agents, so repeated
+# requests skip TCP/TLS setup. Scoped to the loop rather than the process
+# because keepalive sockets are bound to the loop that opened them — run()
+# starts a fresh loop per query, and a connection pooled under an earlier
+# loop raises 'Event loop is closed' when picked up from a later one. The
+# weak keying lets closed loops (and their clients) be collected.
+_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the async HTTP client for the running loop.
+
+    Returns:
+        Shared httpx.AsyncClient with keepalive pooling, HTTP/2 if available
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        try:
+            client = httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            # h2 extra not installed - HTTP/1.1 with keepalive still pools
+            client = httpx.AsyncClient(limits=limits)
+        _http_clients[loop] = client
+    return client
+
+
 class LLMClient:
     """Wrapper around OpenAI client with tool calling support.
     
@@ -27,9 +59,66 @@ class LLMClient:
         """
         self._config = config
         self._client = OpenAI(api_key=config.openai_api_key)
+        # Async SDK clients are built lazily per event loop (the pooled
+        # HTTP client underneath is loop-bound); weak keys let clients
+        # die with their loop
+        self._async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
         self._reasoning_model = config.openai_reasoning_model
         self._inference_model = config.openai_inference_model
-    
+        self._summary_model = config.openai_summary_model
+
+        # Bound concurrent in-flight requests to respect provider rate
+        # limits; like the HTTP client, the semaphore binds to the loop
+        # that first awaits it, so one is kept per loop
+        self._max_concurrent_requests = config.max_concurrent_requests
+        self._request_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def _async_client_kwargs(self) -> dict:
+        """Constructor kwargs for this client's AsyncOpenAI instances.
+
+        Subclasses targeting other OpenAI-compatible endpoints override
+        this instead of building their own async client.
+
+        Returns:
+            Keyword arguments minus the loop-scoped http_client
+        """
+        return {"api_key": self._config.openai_api_key}
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Get (or lazily create) the AsyncOpenAI client for the running loop.
+
+        Returns:
+            AsyncOpenAI backed by the loop's pooled HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                http_client=_get_shared_http_client(),
+                **self._async_client_kwargs()
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """Get (or lazily create) the request semaphore for the running loop.
+
+        Returns:
+            Semaphore bounding in-flight requests on this loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._request_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+            self._request_semaphores[loop] = semaphore
+        return semaphore
+
+
+    @property
+    def summary_model(self) -> str:
+        """Model pinned for conversation summarization/compaction calls."""
+        return self._summary_model
+
     def chat(
         self,
         messages: List[Message],
@@ -37,7 +126,10 @@ class LLMClient:
         tool_choice: str = "auto",
         temperature: Optional[float] = None,
         parallel_tool_calls: bool = True,
-        reason: bool = False
+        reason: bool = False,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        prompt_cache_key: Optional[str] = None
     ) -> LLMResponse:
         """Make a chat completion request.
         
@@ -48,70 +140,216 @@ class LLMClient:
             temperature: Override default temperature
             reason: If True, use reasoning model (more capable, slower). 
                    If False, use inference model (faster, cheaper). Default: False
+            model: Explicit model override; takes precedence over the reason flag
+            response_format: Optional response format constraint
+                (e.g. {"type": "json_object"} for guaranteed-JSON output)
+            prompt_cache_key: Optional stable key hinting the provider to
+                reuse its cached prompt prefix across calls
             
         Returns:
             Parsed LLM response
         """
-        # Select appropriate model based on task type
-        model = self._reasoning_model if reason else self._inference_model
-        
+        params = self._build_params(messages, tools, tool_choice, parallel_tool_calls, reason, model, response_format, prompt_cache_key)
+
+        # Make API call
+        response = self._client.chat.completions.create(**params)
+
+        # Parse and return response
+        return LLMResponse.from_openai_response(response)
+
+    async def achat(
+        self,
+        messages: List[Message],
+        tools: Optional[List[dict]] = None,
+        tool_choice: str = "auto",
+        temperature: Optional[float] = None,
+        parallel_tool_calls: bool = True,
+        reason: bool = False,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        prompt_cache_key: Optional[str] = None
+    ) -> LLMResponse:
+        """Async variant of chat() for use inside an event loop.
+
+        Multiple callers (e.g. concurrent agent runs) can share the event loop
+        and overlap network latency; concurrency is bounded by the client's
+        request semaphore to respect provider rate limits.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of tools in OpenAI format
+            tool_choice: How the model should choose tools ("auto", "none", or specific tool)
+            temperature: Override default temperature
+            reason: If True, use reasoning model (more capable, slower).
+                   If False, use inference model (faster, cheaper). Default: False
+            model: Explicit model override; takes precedence over the reason flag
+            response_format: Optional response format constraint
+                (e.g. {"type": "json_object"} for guaranteed-JSON output)
+            prompt_cache_key: Optional stable key hinting the provider to
+                reuse its cached prompt prefix across calls
+
+        Returns:
+            Parsed LLM response
+        """
+        params = self._build_params(messages, tools, tool_choice, parallel_tool_calls, reason, model, response_format, prompt_cache_key)
+
+        async with self._get_request_semaphore():
+            response = await self._get_async_client().chat.completions.create(**params)
+
+        return LLMResponse.from_openai_response(response)
+
+    async def achat_stream(
+        self,
+        messages: List[Message],
+        on_delta=None,
+        reason: bool = False
+    ) -> LLMResponse:
+        """Stream a content-only completion, yielding text chunks as they arrive.
+
+        Used by callers that want to act on partial output (e.g. speculatively
+        starting the next LLM call before reasoning finishes). Tool calls are
+        not supported on this path; it always requests tool_choice='none'.
+
+        Args:
+            messages: List of conversation messages
+            on_delta: Optional callback invoked with each text chunk as it streams in
+            reason: If True, use reasoning model; otherwise inference model
+
+        Returns:
+            Parsed LLM response assembled from the full stream
+        """
+        params = self._build_params(messages, None, "none", True, reason)
+        params["stream"] = True
+        params["stream_options"] = {"include_usage": True}
+
+        content_parts = []
+        finish_reason = "stop"
+        prompt_tokens = 0
+
+        async with self._get_request_semaphore():
+            stream = await self._get_async_client().chat.completions.create(**params)
+            async for chunk in stream:
+                if chunk.usage:
+                    prompt_tokens = chunk.usage.prompt_tokens
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.delta and choice.delta.content:
+                    content_parts.append(choice.delta.content)
+                    if on_delta:
+                        on_delta(choice.delta.content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+        return LLMResponse(
+            content="".join(content_parts) or None,
+            tool_calls=None,
+            context_length=prompt_tokens,
+            finish_reason=finish_reason
+        )
+
+    def chat_stream_text(
+        self,
+        messages: List[Message],
+        reason: bool = False,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        prompt_cache_key: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream a content-only completion synchronously, chunk by chunk.
+
+        Lets callers act on partial output (display, incremental parsing)
+        instead of blocking until the full generation finishes. Tool calls are
+        not supported on this path.
+
+        Args:
+            messages: List of conversation messages
+            reason: If True, use reasoning model; otherwise inference model
+            model: Explicit model override; takes precedence over the reason flag
+            response_format: Optional response format constraint
+            prompt_cache_key: Optional stable key hinting the provider to
+                reuse its cached prompt prefix across calls
+
+        Yields:
+            Text chunks in generation order
+        """
+        params = self._build_params(messages, None, "none", True, reason, model, response_format, prompt_cache_key)
+        params["stream"] = True
+
+        for chunk in self._client.chat.completions.create(**params):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta and delta.content:
+                yield delta.content
+
+    def _build_params(
+        self,
+        messages: List[Message],
+        tools: Optional[List[dict]],
+        tool_choice: str,
+        parallel_tool_calls: bool,
+        reason: bool,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        prompt_cache_key: Optional[str] = None
+    ) -> dict:
+        """Build the chat completion request parameters shared by chat/achat.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of tools in OpenAI format
+            tool_choice: How the model should choose tools
+            parallel_tool_calls: Whether the model may emit parallel tool calls
+            reason: Whether to use the reasoning model
+            model: Explicit model override; takes precedence over the reason flag
+            response_format: Optional response format constraint passed through
+                to the API (e.g. {"type": "json_object"})
+            prompt_cache_key: Optional stable key passed through so the
+                provider can route calls to its cached prompt prefix
+
+        Returns:
+            Dictionary of request parameters for the OpenAI API
+        """
+        # Select appropriate model: explicit override wins, else task type
+        if model is None:
+            model = self._reasoning_model if reason else self._inference_model
+
         # Convert messages to OpenAI format
         openai_messages = [self._message_to_openai(msg) for msg in messages]
-        
+
         # Prepare request parameters
         params = {
             "model": model,
             "messages": openai_messages,
         }
-        
+
+        if response_format is not None:
+            params["response_format"] = response_format
+
+        if prompt_cache_key is not None:
+            params["prompt_cache_key"] = prompt_cache_key
+
         # Add tools if provided
         if tools:
             params["tools"] = tools
             params["tool_choice"] = tool_choice
             params["parallel_tool_calls"] = parallel_tool_calls
-        
-        # Make API call
-        response = self._client.chat.completions.create(**params)
-        
-        # Parse and return response
-        return LLMResponse.from_openai_response(response)
-    
+
+        return params
+
     def _message_to_openai(self, message: Message) -> dict:
         """Convert Message to OpenAI format.
-        
+
+        Delegates to Message.to_openai_format, which memoizes the converted
+        dict on the message so the history is serialized once, not per call.
+
         Args:
             message: Message object
-            
+
         Returns:
             Dictionary in OpenAI message format
         """
-        result = {"role": message.role}
-        
-        # Add content if present
-        if message.content is not None:
-            result["content"] = message.content
-        
-        # Add tool calls if present
-        if message.tool_calls:
-            result["tool_calls"] = [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.name,
-                        "arguments": json.dumps(tc.arguments) if isinstance(tc.arguments, dict) else tc.arguments
-                    }
-                }
-                for tc in message.tool_calls
-            ]
-        
-        # Add tool call ID for tool messages
-        if message.tool_call_id:
-            result["tool_call_id"] = message.tool_call_id
-        
-        # Add name for tool messages
-        if message.name:
-            result["name"] = message.name
-        
-        return result
+        return message.to_openai_format()
 
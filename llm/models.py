@@ -1,6 +1,6 @@
 """Models for LLM responses."""
 
-import json
+import orjson
 from openai.types.completion_usage import CompletionUsage
 from pydantic import BaseModel, Field
 from typing import List, Optional, Any
@@ -33,20 +33,24 @@ class LLMResponse(BaseModel):
         """
         choice = response.choices[0]
         message = choice.message
-        
-        # Parse tool calls if present
+
+        # Parse tool calls if present. The SDK already validated the payload,
+        # so model_construct skips a redundant validation pass per turn.
         tool_calls = None
         if hasattr(message, "tool_calls") and message.tool_calls:
-            tool_calls = [
-                ToolCall(
+            tool_calls = []
+            for tc in message.tool_calls:
+                parsed = ToolCall.model_construct(
                     id=tc.id,
                     name=tc.function.name,
-                    arguments=json.loads(tc.function.arguments)
+                    arguments=orjson.loads(tc.function.arguments)
                 )
-                for tc in message.tool_calls
-            ]
-        
-        return cls(
+                # Keep the provider's original JSON so echoing the call back
+                # in the history doesn't re-encode the parsed dict
+                parsed._raw_arguments = tc.function.arguments
+                tool_calls.append(parsed)
+
+        return cls.model_construct(
             content=message.content,
             tool_calls=tool_calls,
             context_length=response.usage.prompt_tokens if response.usage else 0,
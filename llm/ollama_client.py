@@ -0,0 +1,40 @@
+"""LLM client backed by a local Ollama server."""
+
+from openai import OpenAI
+from intelligentAgent.config import AgentConfig
+from intelligentAgent.llm.client import LLMClient
+
+
+class OllamaClient(LLMClient):
+    """LLMClient variant that talks to a local Ollama server.
+
+    Ollama exposes an OpenAI-compatible chat completions endpoint, so the
+    whole LLMClient surface (chat, achat, streaming, batching) works
+    unchanged — only the connection details and model names differ. Useful
+    for offloading non-reasoning work like summarization to cheap local
+    inference.
+    """
+
+    def __init__(self, config: AgentConfig):
+        """Initialize the Ollama-backed client.
+
+        Args:
+            config: Agent configuration carrying the Ollama base URL and model
+        """
+        super().__init__(config)
+
+        # Ollama ignores the API key but the SDK requires one
+        self._client = OpenAI(base_url=config.ollama_base_url, api_key="ollama")
+
+        # One local model serves every task grade
+        self._reasoning_model = config.ollama_summary_model
+        self._inference_model = config.ollama_summary_model
+        self._summary_model = config.ollama_summary_model
+
+    def _async_client_kwargs(self) -> dict:
+        """Constructor kwargs pointing the async SDK client at Ollama.
+
+        Returns:
+            Keyword arguments minus the loop-scoped http_client
+        """
+        return {"base_url": self._config.ollama_base_url, "api_key": "ollama"}
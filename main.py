@@ -1,5 +1,6 @@
 """Main entry point and CLI for the intelligent agent."""
 
+import logging
 import sys
 from typing import Optional
 from rich.console import Console
@@ -8,7 +9,7 @@ from rich.markdown import Markdown
 from rich.prompt import Prompt
 from rich import print as rprint
 
-from intelligentAgent.config import AgentConfig
+from intelligentAgent.config import get_config
 from intelligentAgent.llm.client import LLMClient
 from intelligentAgent.agents.react import ReActAgent, MaxIterationsError
 from intelligentAgent.tools.tools.calculator import CalculatorTool
@@ -73,7 +74,7 @@ def create_agent(verbose: bool = False) -> Optional[ReActAgent]:
     """
     try:
         # Load configuration
-        config = AgentConfig()
+        config = get_config()
         
         # Create LLM client
         llm_client = LLMClient(config)
@@ -126,26 +127,27 @@ def interactive_mode(verbose: bool = False):
         try:
             # Get user input
             query = Prompt.ask("\n[bold cyan]You[/bold cyan]")
-            
-            # Handle commands
-            if query.lower() in ["exit", "quit"]:
+
+            # Handle commands (lowercase once instead of per comparison)
+            cmd = query.strip().lower()
+            if cmd in ("exit", "quit"):
                 console.print("\n[yellow]Goodbye! 👋[/yellow]")
                 break
-            
-            elif query.lower() == "help":
+
+            elif cmd == "help":
                 print_help()
                 continue
-            
-            elif query.lower() == "tools":
+
+            elif cmd == "tools":
                 console.print(f"\n[bold]Available tools:[/bold] {', '.join(agent.available_tools)}")
                 continue
-            
-            elif query.lower() == "clear":
+
+            elif cmd == "clear":
                 console.clear()
                 print_banner()
                 continue
-            
-            elif query.lower() == "reset":
+
+            elif cmd == "reset":
                 console.print("\n[yellow]Creating new agent and resetting conversation...[/yellow]")
                 agent = create_agent(verbose=verbose)
                 if not agent:
@@ -154,7 +156,7 @@ def interactive_mode(verbose: bool = False):
                 console.print("[green]✓ New conversation started![/green]")
                 continue
             
-            elif not query.strip():
+            elif not cmd:
                 continue
             
             # Process query with agent
@@ -204,7 +206,13 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # Verbose mode surfaces the agent's debug logging (reasoning, tool calls)
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+        logging.getLogger("openai").setLevel(logging.WARNING)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
     # Single query mode
     if args.query:
         agent = create_agent(verbose=args.verbose)
@@ -29,7 +29,7 @@ WHAT TO INCLUDE:
 
 WHAT TO OMIT:
 ✗ Verbose reasoning steps (keep only key insights)
-✗ Repetitive informationtake the current day mutiply it by the current hour and square it
+✗ Repetitive information
 ✗ Tool execution details (keep only results)
 ✗ Intermediate failed attempts (unless relevant)
 ✗ System/internal messages
@@ -39,3 +39,26 @@ Provide a natural language summary that flows well and can serve as context for
 
 Remember: Your goal is to compress the conversation while preserving all information needed to maintain context and continuity."""
 
+
+ANCHORED_SUMMARY_PROMPT = """You maintain a single structured summary of an ongoing conversation between a user and a financial-analysis assistant.
+
+You are given:
+1. The current structured summary as a JSON object with the keys "intent", "actions", "facts", "tools", "next_steps".
+2. The newest conversation segment (one reason/act/observe cycle, including tool results).
+
+Merge the new segment into the summary and return the FULL updated summary as a JSON object with exactly those five keys:
+- "intent": the user's overall goal or question, refined as it becomes clearer
+- "actions": key actions taken so far, in chronological order
+- "facts": important facts, numbers, and data points discovered so far
+- "tools": comma-separated names of tools used so far
+- "next_steps": open questions or planned next steps, if any
+
+MERGE RULES:
+- Preserve still-relevant information from the existing summary
+- Fold in the new segment's questions, actions, results, and conclusions
+- Drop details the new segment supersedes or resolves
+- Keep each field concise; preserve specific facts, numbers, and data points
+- Every field must be a string
+
+Output ONLY the JSON object, with no surrounding text."""
+
@@ -1,7 +1,8 @@
 """Pydantic schemas for messages and responses."""
 
 from intelligentAgent.schemas.messages import Message, ToolCall, ReActLoop
-from intelligentAgent.schemas.responses import AgentResponse, ToolResult
+from intelligentAgent.schemas.responses import AgentResponse, ToolResult, TraceEvent
+from intelligentAgent.schemas.tokens import TokenCounter, TiktokenCounter
 
-__all__ = ["Message", "AgentResponse", "ToolCall", "ToolResult", "ReActLoop"]
+__all__ = ["Message", "AgentResponse", "ToolCall", "ToolResult", "TraceEvent", "ReActLoop", "TokenCounter", "TiktokenCounter"]
 
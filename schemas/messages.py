@@ -1,33 +1,72 @@
 """Message schema for conversation history."""
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing import Optional, List, Any
 
+from intelligentAgent.schemas.tokens import TokenCounter
+
 
 class ToolCall(BaseModel):
     """Represents a tool call from the LLM."""
-    
+
+    # Immutable once parsed; forbidding extras keeps the core schema lean
+    # for a model constructed per tool call
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Unique identifier for the tool call")
     name: str = Field(..., description="Name of the tool to call")
     arguments: dict[str, Any] = Field(default_factory=dict, description="Arguments for the tool")
 
+    # JSON string of arguments exactly as the provider sent it, kept so
+    # replaying the call to the API skips re-encoding the parsed dict
+    _raw_arguments: Optional[str] = PrivateAttr(default=None)
+
 
 class Message(BaseModel):
     """A message in the conversation history."""
-    
+
+    # Frozen: history messages are replayed to the LLM on every iteration and
+    # their serialized form is memoized, so field mutation after construction
+    # would silently desynchronize the cache. Private attrs stay writable.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     role: str = Field(..., description="Role of the message sender (system, user, assistant, tool)")
     content: Optional[str] = Field(None, description="Content of the message")
     tool_calls: Optional[List[ToolCall]] = Field(None, description="Tool calls made by the assistant")
     tool_call_id: Optional[str] = Field(None, description="ID of the tool call this message responds to")
     name: Optional[str] = Field(None, description="Name of the tool for tool messages")
-    
+
+    # Memoized OpenAI-format dict. Messages are never mutated after they enter
+    # the history, so each one only needs to be serialized once even though it
+    # is resent with every subsequent LLM call.
+    _openai_dict: Optional[dict] = PrivateAttr(default=None)
+
     def to_openai_format(self) -> dict:
-        """Convert to OpenAI API message format."""
-        message = {"role": self.role}
-        
-        if self.content is not None:
-            message["content"] = self.content
-        
+        """Convert to OpenAI API message format.
+
+        Historical messages are resent on every call, so the converted dict
+        is memoized (messages are immutable once in the history) and each
+        message pays the traversal exactly once.
+        """
+        cached = self._openai_dict
+        if cached is not None:
+            return cached
+
+        # Single comprehension so the dict is allocated at its final size
+        # instead of growing through conditional inserts (the falsy-to-None
+        # coercion keeps empty tool_call_id/name excluded as before)
+        message = {
+            key: value
+            for key, value in (
+                ("role", self.role),
+                ("content", self.content),
+                ("tool_call_id", self.tool_call_id or None),
+                ("name", self.name or None),
+            )
+            if value is not None
+        }
+
         if self.tool_calls:
             message["tool_calls"] = [
                 {
@@ -35,20 +74,59 @@ class Message(BaseModel):
                     "type": "function",
                     "function": {
                         "name": tc.name,
-                        "arguments": tc.arguments if isinstance(tc.arguments, str) else str(tc.arguments)
+                        "arguments": tc._raw_arguments
+                        if tc._raw_arguments is not None
+                        else orjson.dumps(tc.arguments).decode() if isinstance(tc.arguments, dict) else tc.arguments
                     }
                 }
                 for tc in self.tool_calls
             ]
-        
-        if self.tool_call_id:
-            message["tool_call_id"] = self.tool_call_id
-        
-        if self.name:
-            message["name"] = self.name
-        
+
+        self._openai_dict = message
         return message
 
+    def to_openai_json(self) -> str:
+        """Serialize to an OpenAI-format JSON string in one pass.
+
+        For callers that want the wire form directly; goes through the
+        memoized dict so repeated calls only pay the orjson encode.
+        """
+        return orjson.dumps(self.to_openai_format()).decode()
+
+
+# Relative importance of roles when deciding what verbatim compaction may
+# drop; system/user are never dropped at all
+_ROLE_WEIGHTS = {"assistant": 2.0, "tool": 1.0}
+
+# Default counter for sizing paths that don't need exact counts; callers
+# wanting accuracy pass a TiktokenCounter instead
+_DEFAULT_COUNTER = TokenCounter()
+
+
+def _estimate_tokens(message: Message, counter: TokenCounter = _DEFAULT_COUNTER) -> int:
+    """Token estimate for one message.
+
+    Args:
+        message: Message to size
+        counter: Token counter to use (defaults to the chars/4 heuristic)
+
+    Returns:
+        Estimated token count
+    """
+    tokens = counter.count(message.content) if message.content else 0
+    if message.tool_calls:
+        # Prefer the provider's raw JSON length; building a repr of the
+        # parsed dict just to measure it is a wasted string allocation
+        tokens += sum(
+            counter.count(tc.name) + counter.count(
+                tc._raw_arguments
+                if tc._raw_arguments is not None
+                else str(tc.arguments)
+            )
+            for tc in message.tool_calls
+        )
+    return tokens
+
 
 class ReActLoop(BaseModel):
     """Container for a single ReAct loop iteration containing all messages.
@@ -57,11 +135,23 @@ class ReActLoop(BaseModel):
     providing better context control and cleaner separation of loop-scoped data.
     used to allow compaction of previous start of conversaation when context grows
     """
-    
+
+    # Mutable (messages/tools_used grow in place) but closed to stray fields;
+    # all field types are standard so arbitrary_types_allowed isn't needed
+    model_config = ConfigDict(extra="forbid")
+
     messages: List[Message] = Field(default_factory=list, description="Messages in this loop")
     iteration: int = Field(default=0, description="Loop iteration number")
     tools_used: List[str] = Field(default_factory=list, description="Tools used in this loop")
 
+    # Set mirror of tools_used for O(1) dedupe on append; seeded lazily so
+    # loops constructed with an initial tools_used list stay consistent
+    _tools_used_set: Optional[set] = PrivateAttr(default=None)
+
+    # First user message content, captured on append (or first lookup) so
+    # get_user_query doesn't rescan the messages every call
+    _user_query: Optional[str] = PrivateAttr(default=None)
+
     
     def add_message(
         self,
@@ -76,39 +166,161 @@ class ReActLoop(BaseModel):
             content: Message content
             **kwargs: Additional message fields (tool_calls, tool_call_id, etc.)
         """
-        message = Message(role=role, content=content, **kwargs)
+        self.append(Message(role=role, content=content, **kwargs))
+
+    def add_message_fast(
+        self,
+        role: str,
+        content: Optional[str] = None,
+        **kwargs
+    ) -> None:
+        """Add an internally-generated message, skipping validation.
+
+        Trusted-path variant of add_message: model_construct bypasses
+        pydantic's validator dispatch, so fields must already be correctly
+        typed (strings we built ourselves, ToolCall objects parsed from the
+        SDK). Messages assembled from untrusted LLM or tool JSON should keep
+        using add_message.
+
+        Args:
+            role: Message role (system, user, assistant, tool)
+            content: Message content
+            **kwargs: Additional message fields (tool_calls, tool_call_id, etc.)
+        """
+        self.append(Message.model_construct(role=role, content=content, **kwargs))
+
+    def append(self, message: Message) -> None:
+        """Append an already-constructed Message to this loop.
+
+        Lets callers that share one Message between the global history and the
+        loop avoid building (and validating) it twice.
+
+        Args:
+            message: Message object to append
+        """
         self.messages.append(message)
-        
-        # Track tools used
-        if kwargs.get('tool_calls'):
-            for tc in kwargs['tool_calls']:
-                if tc.name not in self.tools_used:
+
+        # Capture the loop's user query the moment it arrives
+        if message.role == "user" and self._user_query is None:
+            self._user_query = message.content
+
+        # Track tools used; the set mirror keeps dedupe O(1) per call
+        # instead of a linear scan of tools_used
+        if message.tool_calls:
+            if self._tools_used_set is None:
+                self._tools_used_set = set(self.tools_used)
+            for tc in message.tool_calls:
+                if tc.name not in self._tools_used_set:
+                    self._tools_used_set.add(tc.name)
                     self.tools_used.append(tc.name)
     
     def get_messages(self) -> List[Message]:
         """Get all messages in this loop.
-        
+
         Returns:
             List of messages
         """
         return self.messages
-    
+
     def get_user_query(self) -> Optional[str]:
         """Extract the user query from this loop.
-        
+
+        Cached after the first lookup (or on append), since a loop's user
+        query never changes once set.
+
         Returns:
             User query string or None if not found
         """
-        for msg in self.messages:
-            if msg.role == "user":
-                return msg.content
-        return None
+        if self._user_query is None:
+            # Loops built directly from a message list haven't captured it yet
+            for msg in self.messages:
+                if msg.role == "user":
+                    self._user_query = msg.content
+                    break
+        return self._user_query
     
     def clear(self) -> None:
         """Clear all messages from this loop."""
         self.messages.clear()
         self.tools_used.clear()
+        self._tools_used_set = None
+        self._user_query = None
     
+    def estimated_tokens(self, counter: Optional[TokenCounter] = None) -> int:
+        """Token estimate for this loop.
+
+        Args:
+            counter: Token counter to use; defaults to the chars/4 heuristic
+                (pass a TiktokenCounter for exact counts)
+
+        Returns:
+            Estimated token count across all messages
+        """
+        counter = counter or _DEFAULT_COUNTER
+        return sum(_estimate_tokens(msg, counter) for msg in self.messages)
+
+    def compact_verbatim(self, budget_tokens: int) -> int:
+        """Drop low-signal messages verbatim until the loop fits a budget.
+
+        LLM-free alternative to summarization: messages are deleted whole,
+        never paraphrased, so surviving tool outputs, numbers, and error
+        strings stay exact. System and user messages are always kept, and an
+        assistant tool-call message is dropped together with its tool results
+        so the remaining history stays well-formed. Lowest-signal units
+        (old, low-role-weight, bulky) go first.
+
+        Args:
+            budget_tokens: Target loop size using the chars/4 heuristic
+
+        Returns:
+            Number of messages dropped
+        """
+        total = self.estimated_tokens()
+        if total <= budget_tokens:
+            return 0
+
+        count = len(self.messages)
+
+        # Group droppable messages into units: a lone assistant message, or
+        # an assistant tool-call plus the tool results answering it
+        units = []  # (signal, token_estimate, indices)
+        i = 0
+        while i < count:
+            msg = self.messages[i]
+            if msg.role not in _ROLE_WEIGHTS:
+                i += 1
+                continue
+
+            indices = [i]
+            tokens = _estimate_tokens(msg)
+            if msg.role == "assistant" and msg.tool_calls:
+                j = i + 1
+                while j < count and self.messages[j].role == "tool":
+                    indices.append(j)
+                    tokens += _estimate_tokens(self.messages[j])
+                    j += 1
+
+            # Higher signal = kept longer: role weight scaled up by recency,
+            # scaled down by bulk
+            recency = 1.0 + indices[-1] / count
+            signal = _ROLE_WEIGHTS[msg.role] * recency / (1.0 + tokens / 100.0)
+            units.append((signal, tokens, indices))
+            i = indices[-1] + 1
+
+        dropped = set()
+        for signal, tokens, indices in sorted(units):
+            if total <= budget_tokens:
+                break
+            dropped.update(indices)
+            total -= tokens
+
+        if not dropped:
+            return 0
+        self.messages[:] = [
+            msg for i, msg in enumerate(self.messages) if i not in dropped
+        ]
+        return len(dropped)
+
     def message_count(self) -> int:
         """Get the number of messages in this loop.
         
@@ -116,8 +328,4 @@ class ReActLoop(BaseModel):
             Message count
         """
         return len(self.messages)
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
 
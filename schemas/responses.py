@@ -1,12 +1,46 @@
 """Response schemas for agent outputs."""
 
-from pydantic import BaseModel, Field
-from typing import Any, List
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, List, Literal
+
+
+# Prefixes for rendering trace events as human-readable lines
+_TRACE_PREFIXES = {
+    "thought": "Thought",
+    "action": "Action",
+    "observation": "Observation",
+}
+
+
+@dataclass(slots=True)
+class TraceEvent:
+    """A single reasoning-trace event, stored structurally and formatted lazily.
+
+    A plain slots dataclass rather than a pydantic model: events are created
+    in the agent's hot loop from trusted internal data, so validation would
+    be pure overhead and slots keep per-event memory small.
+    """
+
+    kind: Literal["thought", "action", "observation"]
+    payload: str
+
+    def format(self) -> str:
+        """Render the event as its human-readable trace line.
+
+        Returns:
+            Formatted trace line (e.g. "Thought: ...")
+        """
+        return f"{_TRACE_PREFIXES[self.kind]}: {self.payload}"
 
 
 class ToolResult(BaseModel):
     """Result from executing a tool."""
-    
+
+    # One instance per tool execution; immutable once built and closed to
+    # stray fields to keep construction cheap
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     tool_call_id: str = Field(..., description="ID of the tool call this result corresponds to")
     arguments: dict[str, Any] = Field(..., description="Arguments used to execute the tool")
     content: str = Field(..., description="Result content from the tool execution")
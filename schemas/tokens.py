@@ -0,0 +1,63 @@
+"""Token counting helpers for compaction budgeting."""
+
+from typing import Dict
+
+
+class TokenCounter:
+    """Estimates token counts with the chars/4 heuristic.
+
+    Fast enough to run before every LLM call: counting is a length lookup
+    and a shift, no encoding pass. Good to within ~10-20% on English prose
+    and JSON, which is plenty for thresholding compaction decisions.
+    """
+
+    def count(self, text: str) -> int:
+        """Estimate the token count of a string.
+
+        Args:
+            text: Text to size
+
+        Returns:
+            Estimated token count (rounded up)
+        """
+        return (len(text) + 3) >> 2
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact token counts via tiktoken, for callers that need accuracy.
+
+    Requires the optional tiktoken dependency; construction raises
+    ImportError when it is not installed, so callers can fall back to the
+    base heuristic counter. Encoders are cached per encoding name since
+    building one is expensive.
+    """
+
+    # Class-level encoder cache shared by all instances
+    _encoders: Dict[str, object] = {}
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        """Initialize the counter, building the encoder once per encoding.
+
+        Args:
+            encoding: tiktoken encoding name
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        encoder = self._encoders.get(encoding)
+        if encoder is None:
+            import tiktoken
+            encoder = tiktoken.get_encoding(encoding)
+            self._encoders[encoding] = encoder
+        self._encoder = encoder
+
+    def count(self, text: str) -> int:
+        """Count the exact number of tokens in a string.
+
+        Args:
+            text: Text to size
+
+        Returns:
+            Token count under the configured encoding
+        """
+        return len(self._encoder.encode(text))
@@ -1,7 +1,7 @@
 from setuptools import setup, find_packages
 
-# Find all packages but exclude venv
-packages = [pkg for pkg in find_packages() if not pkg.startswith('venv')]
+# Exclude venv/build/tests inside the walk instead of filtering afterwards
+packages = find_packages(exclude=("venv", "venv.*", "build", "build.*", "tests", "tests.*"))
 
 setup(
     name="intelligent-agent",
@@ -15,7 +15,10 @@ setup(
         "python-dotenv>=1.0.0",
         "rich>=13.0.0",
         "requests>=2.31.0",
+        "urllib3[brotli]>=1.26.0",
+        "httpx[http2]>=0.24.0",
+        "orjson>=3.8.0",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.11",
 )
 
@@ -1,5 +1,7 @@
 """Abstract base class for all tools."""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import Type
 from pydantic import BaseModel
@@ -19,26 +21,28 @@ class BaseTool(ABC):
     description: str
     args_schema: Type[BaseModel]
     
-    def to_openai_tool(self) -> dict:
-        """Convert tool to OpenAI function calling format.
-        
-        Returns:
-            Dictionary in OpenAI's tool format with function name, description, and parameters.
+    @functools.cached_property
+    def openai_tool(self) -> dict:
+        """Tool schema in OpenAI function calling format, built once.
+
+        name, description, and args_schema are immutable after definition,
+        so the JSON-schema walk and dict assembly only need to happen on
+        first access.
         """
         # Get JSON schema from Pydantic model
         schema = self.args_schema.model_json_schema()
-        
+
         # Remove Pydantic-specific fields that aren't needed
         schema.pop("title", None)
-        
+
         # For strict mode, additionalProperties must be false
         schema["additionalProperties"] = False
-        
+
         # For strict mode, ALL properties must be in the required array
         # (even those with defaults)
         if "properties" in schema:
             schema["required"] = list(schema["properties"].keys())
-        
+
         return {
             "type": "function",
             "function": {
@@ -48,6 +52,14 @@ class BaseTool(ABC):
                 "parameters": schema
             }
         }
+
+    def to_openai_tool(self) -> dict:
+        """Convert tool to OpenAI function calling format.
+
+        Returns:
+            Dictionary in OpenAI's tool format with function name, description, and parameters.
+        """
+        return self.openai_tool
     
     @abstractmethod
     def execute(self, **kwargs) -> str:
@@ -62,7 +74,24 @@ class BaseTool(ABC):
             String result to be passed back to the LLM
         """
         pass
-    
+
+    async def aexecute(self, **kwargs) -> str:
+        """Async counterpart to execute().
+
+        The default implementation runs the synchronous execute() in the event
+        loop's default thread pool, so legacy sync tools (file I/O, requests)
+        don't block the loop when executed concurrently. Tools with native
+        async I/O should override this directly.
+
+        Args:
+            **kwargs: Arguments matching the args_schema definition
+
+        Returns:
+            String result to be passed back to the LLM
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.execute, **kwargs))
+
     def __repr__(self) -> str:
         """String representation of the tool."""
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -1,6 +1,6 @@
 """Tool registry for centralized tool management."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from intelligentAgent.tools.base import BaseTool
 
 
@@ -13,20 +13,27 @@ class ToolRegistry:
     def __init__(self):
         """Initialize empty tool registry."""
         self._tools: Dict[str, BaseTool] = {}
-    
+        # Schemas are accumulated at registration so LLM-request paths can
+        # fetch them without rebuilding per call; the tuple handed to
+        # callers is cached and only invalidated by register()
+        self._openai_schemas: List[dict] = []
+        self._schemas_cache: Optional[Tuple[dict, ...]] = None
+
     def register(self, tool: BaseTool) -> None:
         """Register a tool in the registry.
-        
+
         Args:
             tool: Tool instance to register
-            
+
         Raises:
             ValueError: If a tool with the same name is already registered
         """
         if tool.name in self._tools:
             raise ValueError(f"Tool with name '{tool.name}' is already registered")
-        
+
         self._tools[tool.name] = tool
+        self._openai_schemas.append(tool.to_openai_tool())
+        self._schemas_cache = None
     
     def get(self, name: str) -> BaseTool:
         """Get a tool by name.
@@ -40,18 +47,23 @@ class ToolRegistry:
         Raises:
             KeyError: If tool with given name is not found
         """
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise KeyError(f"Tool '{name}' not found in registry. Available tools: {list(self._tools.keys())}")
-        
-        return self._tools[name]
+
+        return tool
     
-    def get_openai_schemas(self) -> List[dict]:
+    def get_openai_schemas(self) -> Tuple[dict, ...]:
         """Get all tools in OpenAI function calling format.
-        
+
         Returns:
-            List of tool schemas in OpenAI's expected format
+            Tuple of tool schemas in OpenAI's expected format; the same
+            cached tuple is shared across calls (invalidated only by
+            register), and being immutable it can't be corrupted by callers
         """
-        return [tool.to_openai_tool() for tool in self._tools.values()]
+        if self._schemas_cache is None:
+            self._schemas_cache = tuple(self._openai_schemas)
+        return self._schemas_cache
     
     def list_tools(self) -> List[str]:
         """Get list of registered tool names.
@@ -1,9 +1,46 @@
-"""Example tool implementations."""
+"""Example tool implementations.
 
-from intelligentAgent.tools.tools.calculator import CalculatorTool
-from intelligentAgent.tools.tools.datetime_tool import DateTimeTool
-from intelligentAgent.tools.tools.stock_tool import StockTool
-from intelligentAgent.tools.tools.marketaux_tool import MarketauxTool
+Tool classes are resolved lazily (PEP 562) so importing this package does
+not pull in every tool's dependency stack — the HTTP-backed tools drag in
+their client libraries — when only a subset gets registered.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from intelligentAgent.tools.tools.calculator import CalculatorTool
+    from intelligentAgent.tools.tools.datetime_tool import DateTimeTool
+    from intelligentAgent.tools.tools.stock_tool import StockTool
+    from intelligentAgent.tools.tools.marketaux_tool import MarketauxTool
 
 __all__ = ["CalculatorTool", "DateTimeTool", "StockTool", "MarketauxTool"]
 
+# Tool class name -> defining submodule
+_LAZY_IMPORTS = {
+    "CalculatorTool": "calculator",
+    "DateTimeTool": "datetime_tool",
+    "StockTool": "stock_tool",
+    "MarketauxTool": "marketaux_tool",
+}
+
+
+def __getattr__(name: str):
+    """Import a tool class on first attribute access.
+
+    Args:
+        name: Attribute being resolved on the package
+
+    Returns:
+        The requested tool class
+
+    Raises:
+        AttributeError: If name is not a known tool class
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    attr = getattr(module, name)
+    globals()[name] = attr  # cache so later accesses skip __getattr__
+    return attr
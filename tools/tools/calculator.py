@@ -1,13 +1,89 @@
 """Calculator tool for mathematical operations."""
 
+import ast
+import functools
+import math
+
 from pydantic import BaseModel, Field
 from typing import Type
 from intelligentAgent.tools.base import BaseTool
 
 
+# Safe namespace with only math functions, built once at import instead of
+# per execute() call
+_SAFE_NS = {
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "pow": pow,
+    # Math module functions
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "pi": math.pi,
+    "e": math.e,
+    "log": math.log,
+    "log10": math.log10,
+    "exp": math.exp,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
+# AST nodes a vetted expression may contain: literals, arithmetic/comparison
+# operators, tuples/lists (for min/max/sum), and calls to _SAFE_NS names,
+# including keyword arguments (e.g. log(100, base=10), round(x, ndigits=2))
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+    ast.keyword,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Tuple,
+    ast.List,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(expression: str) -> object:
+    """Validate and compile an expression, cached per expression string.
+
+    LLMs frequently repeat the exact same expression across loops and
+    sessions, so the parse/validate/compile work is paid once per distinct
+    expression.
+
+    Args:
+        expression: Mathematical expression to compile
+
+    Returns:
+        Code object ready for eval against _SAFE_NS
+
+    Raises:
+        ValueError: If the expression uses names or syntax outside the
+            whitelisted math subset
+        SyntaxError: If the expression does not parse
+    """
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in _SAFE_NS:
+            raise ValueError(f"Unknown name: {node.id}")
+    return compile(tree, "<calc>", "eval")
+
+
 class CalculatorInput(BaseModel):
     """Input schema for calculator tool."""
-    
+
     expression: str = Field(
         ...,
         description="Mathematical expression to evaluate (e.g., '2 + 2', '10 * 5 + 3', 'sqrt(16)')"
@@ -16,56 +92,32 @@ class CalculatorInput(BaseModel):
 
 class CalculatorTool(BaseTool):
     """Tool for performing mathematical calculations.
-    
+
     Supports basic arithmetic operations and common mathematical functions.
-    Uses Python's eval() with a restricted namespace for safety.
+    Expressions are validated against an AST whitelist, compiled once per
+    distinct expression, and evaluated against a restricted namespace.
     """
-    
+
     name: str = "calculator"
     description: str = "Perform mathematical calculations. Supports basic arithmetic (+, -, *, /), exponents (**), and functions like sqrt, sin, cos, etc."
     args_schema: Type[BaseModel] = CalculatorInput
-    
+
     def execute(self, expression: str) -> str:
         """Execute a mathematical calculation.
-        
+
         Args:
             expression: Mathematical expression to evaluate
-            
+
         Returns:
             String result of the calculation
         """
-        import math
-        
-        # Safe namespace with only math functions
-        safe_dict = {
-            "abs": abs,
-            "round": round,
-            "min": min,
-            "max": max,
-            "sum": sum,
-            "pow": pow,
-            # Math module functions
-            "sqrt": math.sqrt,
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "pi": math.pi,
-            "e": math.e,
-            "log": math.log,
-            "log10": math.log10,
-            "exp": math.exp,
-            "floor": math.floor,
-            "ceil": math.ceil,
-        }
-        
         try:
-            # Evaluate expression with restricted namespace
-            result = eval(expression, {"__builtins__": {}}, safe_dict)
+            # Evaluate the cached compiled expression with restricted namespace
+            result = eval(_compile(expression), {"__builtins__": {}}, _SAFE_NS)
             return f"Result: {result}"
-        
+
         except ZeroDivisionError:
             return "Error: Division by zero"
-        
+
         except Exception as e:
             return f"Error evaluating expression: {str(e)}"
-
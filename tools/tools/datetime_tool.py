@@ -3,8 +3,26 @@
 from pydantic import BaseModel, Field
 from typing import Type, Literal
 from datetime import datetime, timezone
+from time import time as _time
 from intelligentAgent.tools.base import BaseTool
 
+# Bound once so per-call lookups skip the timezone module attribute chain
+_UTC = timezone.utc
+
+
+# (format_type, timezone_info) -> (prefix, strftime format, suffix), built
+# once at import so execute() is a dict lookup plus one strftime instead of
+# an if/elif chain with conditional concatenations. timestamp/iso are
+# computed rather than strftime-formatted and handled before the lookup.
+_FORMATS = {
+    ("datetime", True): ("Current datetime: ", "%Y-%m-%d %H:%M:%S", " UTC"),
+    ("datetime", False): ("Current datetime: ", "%Y-%m-%d %H:%M:%S", ""),
+    ("date", True): ("Current date: ", "%Y-%m-%d", ""),
+    ("date", False): ("Current date: ", "%Y-%m-%d", ""),
+    ("time", True): ("Current time: ", "%H:%M:%S", " UTC"),
+    ("time", False): ("Current time: ", "%H:%M:%S", ""),
+}
+
 
 class DateTimeInput(BaseModel):
     """Input schema for datetime tool."""
@@ -40,37 +58,20 @@ class DateTimeTool(BaseTool):
         Returns:
             Formatted datetime string
         """
+        # Unix time needs no datetime object at all
+        if format_type == "timestamp":
+            return f"Current Unix timestamp: {int(_time())}"
+
         # Get current time
-        now = datetime.now(timezone.utc) if timezone_info else datetime.now()
-        
-        try:
-            if format_type == "datetime":
-                result = now.strftime("%Y-%m-%d %H:%M:%S")
-                if timezone_info:
-                    result += " UTC"
-                return f"Current datetime: {result}"
-            
-            elif format_type == "date":
-                result = now.strftime("%Y-%m-%d")
-                return f"Current date: {result}"
-            
-            elif format_type == "time":
-                result = now.strftime("%H:%M:%S")
-                if timezone_info:
-                    result += " UTC"
-                return f"Current time: {result}"
-            
-            elif format_type == "timestamp":
-                result = int(now.timestamp())
-                return f"Current Unix timestamp: {result}"
-            
-            elif format_type == "iso":
-                result = now.isoformat()
-                return f"Current datetime (ISO 8601): {result}"
-            
-            else:
-                return f"Unknown format type: {format_type}"
-        
-        except Exception as e:
-            return f"Error getting datetime: {str(e)}"
+        now = datetime.now(_UTC) if timezone_info else datetime.now()
+
+        if format_type == "iso":
+            return f"Current datetime (ISO 8601): {now.isoformat()}"
+
+        entry = _FORMATS.get((format_type, timezone_info))
+        if entry is None:
+            return f"Unknown format type: {format_type}"
+
+        prefix, fmt, suffix = entry
+        return f"{prefix}{now.strftime(fmt)}{suffix}"
 
@@ -1,16 +1,101 @@
 """Financial news and market data tool using Marketaux API."""
 
+import asyncio
+import bisect
+import heapq
+import math
+import operator
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
+import orjson
 from pydantic import BaseModel, Field
-from typing import Type, Literal, Optional, Dict, Any
+from typing import Type, Literal, Optional, Dict, Any, List
 from requests import Response
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from intelligentAgent.tools.base import BaseTool
-from intelligentAgent.config import AgentConfig
+from intelligentAgent.config import AgentConfig, get_config
+
+
+# In-process TTL cache for API responses, shared across tool instances and
+# threads. Agents frequently re-issue the same query across reasoning steps;
+# within the TTL those repeats skip the network entirely. Keys never include
+# the api_token. Insertion-ordered dict gives FIFO eviction like SummaryCache.
+_CACHE_MAX_ENTRIES = 512
+_response_cache: Dict[tuple, tuple] = {}  # key -> (expires_at, json data)
+_cache_lock = threading.Lock()
+
+# Per-query-type TTL overrides (seconds): trending churns fast, entity
+# lookups are near-static. Everything else uses the configured default.
+_TRENDING_TTL = 60
+_ENTITY_SEARCH_TTL = 600
+
+# (connect, read) timeout so a stalled API call can't hang the agent loop
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Advertise brotli only when a decoder is importable; requesting br without
+# one would leave the body undecoded. Falls back to gzip/deflate otherwise.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+# Caps concurrent Marketaux requests across threads so parallel per-symbol
+# fan-out stays under the provider's per-minute rate limit
+_rate_limit = threading.Semaphore(4)
+
+# Async counterpart, kept per event loop (an asyncio.Semaphore binds to
+# the loop that first awaits it, and run() starts a fresh loop per query);
+# weak keys let closed loops and their semaphores be collected
+_arate_limits: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_arate_limit() -> asyncio.Semaphore:
+    """Get (or lazily create) the request semaphore for the running loop.
+
+    Returns:
+        Semaphore capping concurrent Marketaux requests on this loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _arate_limits.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(4)
+        _arate_limits[loop] = semaphore
+    return semaphore
+
+# Sentiment classification bands: negative below -0.1, positive strictly
+# above 0.1, neutral between (inclusive). The upper break is the smallest
+# float above 0.1 so bisect_right lands scores of exactly 0.1 in neutral,
+# matching the original comparison chain
+_SENT_BREAKS = (-0.1, math.nextafter(0.1, math.inf))
+_SENT_LABELS = ("📉 Negative", "➖ Neutral", "📈 Positive")
+_SENT_KEYS = ("negative", "neutral", "positive")
+
+
+def _sent_label(sentiment: float) -> str:
+    """Classify a sentiment score into its display label.
+
+    Args:
+        sentiment: Entity sentiment score
+
+    Returns:
+        Emoji-prefixed label for the score's band
+    """
+    return _SENT_LABELS[bisect.bisect_right(_SENT_BREAKS, sentiment)]
 
 
 class MarketauxInput(BaseModel):
     """Input schema for marketaux financial news and market data tool."""
-    
+
     symbols: Optional[str] = Field(
         default=None,
         description=(
@@ -20,7 +105,7 @@ class MarketauxInput(BaseModel):
             "Not needed for 'trending' query type (leave empty or None)."
         )
     )
-    
+
     query_type: Literal["news", "entity_search", "trending", "performance"] = Field(
         default="news",
         description=(
@@ -31,24 +116,24 @@ class MarketauxInput(BaseModel):
             "• 'performance': Get sentiment analysis and stats for SPECIFIC STOCKS (requires symbols='TSLA,NVDA')"
         )
     )
-    
+
     sentiment_filter: Optional[Literal["positive", "negative", "neutral"]] = Field(
         default=None,
         description="Filter news by sentiment: 'positive', 'negative', or 'neutral'"
     )
-    
+
     language: str = Field(
         default="en",
         description="Language code for news articles (e.g., 'en' for English)"
     )
-    
+
     limit: int = Field(
         default=5,
         ge=1,
         le=50,
         description="Number of results to return (1-50)"
     )
-    
+
     filter_entities: bool = Field(
         default=True,
         description="When true, only return entities relevant to your query with each article"
@@ -57,11 +142,11 @@ class MarketauxInput(BaseModel):
 
 class MarketauxTool(BaseTool):
     """Tool for fetching financial news and market data using Marketaux API.
-    
-    Provides access to global financial news, entity search, trending stocks, 
+
+    Provides access to global financial news, entity search, trending stocks,
     and market performance data with sentiment analysis.
     """
-    
+
     name: str = "get_market_news"
     description: str = (
         "Get financial news and market data with AI-powered sentiment analysis from 5,000+ global sources. "
@@ -85,14 +170,59 @@ class MarketauxTool(BaseTool):
     )
     args_schema: Type[BaseModel] = MarketauxInput
     BASE_URL: str = "https://api.marketaux.com/v1"
-    
+
     def __init__(self):
         """Initialize the marketaux tool with API configuration."""
         super().__init__()
-        self.config: AgentConfig = AgentConfig()
+        self.config: AgentConfig = get_config()
         self.api_key: str = self.config.marketaux_api_key
         self.base_url: str = self.BASE_URL
-    
+
+        # Pooled session: keepalive reuses the TLS connection to the API
+        # host across calls instead of re-handshaking per request, and
+        # transient gateway errors get a short retry with backoff
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        ))
+        self._session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
+        # Async clients for aexecute, created lazily per event loop: a
+        # client's keepalive connections are bound to the loop that opened
+        # them, so a single cached client breaks on the next query's loop
+        self._aclients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def __del__(self):
+        """Close the pooled session when the tool is collected."""
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Get (or lazily create) the pooled async client for the running loop.
+
+        Returns:
+            httpx.AsyncClient with keepalive pooling, HTTP/2 if available
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            limits = httpx.Limits(max_connections=10)
+            try:
+                client = httpx.AsyncClient(http2=True, limits=limits, timeout=10)
+            except ImportError:
+                # h2 extra not installed - HTTP/1.1 with keepalive still pools
+                client = httpx.AsyncClient(limits=limits, timeout=10)
+            self._aclients[loop] = client
+        return client
+
     def execute(
         self,
         symbols: Optional[str] = None,
@@ -103,7 +233,7 @@ class MarketauxTool(BaseTool):
         filter_entities: bool = True
     ) -> str:
         """Fetch financial news and market data from Marketaux.
-        
+
         Args:
             symbols: Comma-separated stock ticker symbols (e.g., 'AAPL,MSFT,GOOGL').
                     Required for 'news' and 'performance' query types.
@@ -120,69 +250,270 @@ class MarketauxTool(BaseTool):
             language: Language code for news articles (default: 'en' for English)
             limit: Number of results to return (1-50, default: 5)
             filter_entities: If True, only return entities relevant to query
-            
+
         Returns:
             Formatted string with news/market data appropriate to the query type
         """
+        handler = self._DISPATCH.get(query_type)
+        if handler is None:
+            return f"Error: Unknown query_type '{query_type}'"
+
+        if not symbols and query_type in self._SYMBOLS_ERRORS:
+            return self._SYMBOLS_ERRORS[query_type]
+
+        if symbols and query_type != "entity_search":
+            # Canonicalize once so handlers skip per-use upper() and
+            # equivalent spellings share a TTL cache entry; entity_search
+            # takes free-form keywords and is exempt
+            symbols = symbols.upper().replace(" ", "")
+
         try:
-            if query_type == "news":
-                if not symbols:
-                    return "Error: 'symbols' parameter is required for news queries. Please provide stock ticker symbols (e.g., 'AAPL,MSFT')."
-                return self._get_news(symbols, sentiment_filter, language, limit, filter_entities)
-            elif query_type == "entity_search":
-                if not symbols:
-                    return "Error: 'symbols' parameter is required for entity search. Use it as search keywords (e.g., 'Apple', 'Microsoft')."
-                return self._search_entity(symbols, limit)
-            elif query_type == "trending":
-                return self._get_trending(limit)
-            elif query_type == "performance":
-                if not symbols:
-                    return "Error: 'symbols' parameter is required for performance queries. Please provide stock ticker symbols."
-                return self._get_performance(symbols, limit)
-            else:
-                return f"Error: Unknown query_type '{query_type}'"
-                
+            return handler(self, symbols, sentiment_filter, language, limit, filter_entities)
         except Exception as e:
             return f"Error fetching market data: {str(e)}"
-    
-    def _make_api_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def aexecute(
+        self,
+        symbols: Optional[str] = None,
+        query_type: str = "news",
+        sentiment_filter: Optional[str] = None,
+        language: str = "en",
+        limit: int = 5,
+        filter_entities: bool = True
+    ) -> str:
+        """Async variant of execute for use inside an event loop.
+
+        Fetches go through a pooled httpx.AsyncClient, so concurrent tool
+        calls (and the per-symbol fan-out in performance queries) overlap
+        on the event loop instead of serializing or occupying executor
+        threads. Formatting is shared with the sync path.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols; see execute
+            query_type: Type of data to fetch; see execute
+            sentiment_filter: Filter news by sentiment; see execute
+            language: Language code for news articles
+            limit: Number of results to return (1-50)
+            filter_entities: If True, only return entities relevant to query
+
+        Returns:
+            Formatted string with news/market data appropriate to the query type
+        """
+        handler = self._ADISPATCH.get(query_type)
+        if handler is None:
+            return f"Error: Unknown query_type '{query_type}'"
+
+        if not symbols and query_type in self._SYMBOLS_ERRORS:
+            return self._SYMBOLS_ERRORS[query_type]
+
+        if symbols and query_type != "entity_search":
+            # Same canonicalization and exemption as execute
+            symbols = symbols.upper().replace(" ", "")
+
+        try:
+            return await handler(self, symbols, sentiment_filter, language, limit, filter_entities)
+        except Exception as e:
+            return f"Error fetching market data: {str(e)}"
+
+    async def _aget_news(
+        self,
+        symbols: str,
+        sentiment_filter: Optional[str],
+        language: str,
+        limit: int,
+        filter_entities: bool
+    ) -> str:
+        """Async variant of _get_news.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols
+            sentiment_filter: Filter by sentiment (positive/negative/neutral)
+            language: Language code for articles
+            limit: Number of articles to return
+            filter_entities: Whether to filter entities in response
+
+        Returns:
+            Formatted news articles with sentiment analysis
+        """
+        params = self._news_params(symbols, sentiment_filter, language, limit, filter_entities)
+        data = await self._amake_api_request("/news/all", params)
+        return self._format_news(data, symbols)
+
+    async def _asearch_entity(self, keywords: str, limit: int) -> str:
+        """Async variant of _search_entity.
+
+        Args:
+            keywords: Search keywords (company name, etc.)
+            limit: Number of results to return
+
+        Returns:
+            List of matching entities with their details
+        """
+        params = {"search": keywords, "limit": limit, "must_have_entities": "true"}
+        data = await self._amake_api_request("/news/all", params, ttl=_ENTITY_SEARCH_TTL)
+        return self._format_search(data, keywords, limit)
+
+    async def _aget_trending(self, limit: int) -> str:
+        """Async variant of _get_trending.
+
+        Args:
+            limit: Number of trending entities to return
+
+        Returns:
+            List of trending entities with mention counts
+        """
+        params = {"limit": 50, "must_have_entities": "true", "language": "en"}
+        data = await self._amake_api_request("/news/all", params, ttl=_TRENDING_TTL)
+        return self._format_trending(data, limit)
+
+    def _make_api_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Make an API request to Marketaux and return JSON data.
-        
+
+        Responses are cached in-process for the TTL, keyed by endpoint and
+        query parameters (excluding the api token), so identical queries
+        within the window reuse the parsed JSON instead of re-hitting the
+        network.
+
         Args:
             endpoint: API endpoint path (e.g., '/news/all')
             params: Dictionary of query parameters for the API request
-            
+            ttl: Cache lifetime in seconds; defaults to the configured
+                marketaux_cache_ttl
+
         Returns:
             JSON response data as a dictionary
-            
+
         Raises:
             requests.HTTPError: If the HTTP request fails
         """
+        if ttl is None:
+            ttl = self.config.marketaux_cache_ttl
+
+        # Key on the request shape before the token is added
+        key = (endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+
+        if ttl > 0:
+            cached = self._cache_get(key, now)
+            if cached is not None:
+                return cached
+
         params["api_token"] = self.api_key
         url = f"{self.base_url}{endpoint}"
-        response: Response = requests.get(url, params=params)
+        with _rate_limit:
+            response: Response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
-    
-    def _get_news(
+        # orjson decodes the raw bytes directly, skipping both stdlib json
+        # and the intermediate text decode response.json() would do
+        data = orjson.loads(response.content)
+
+        if ttl > 0:
+            self._cache_put(key, data, now + ttl)
+
+        return data
+
+    async def _amake_api_request(
         self,
+        endpoint: str,
+        params: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of _make_api_request, sharing the same cache.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/news/all')
+            params: Dictionary of query parameters for the API request
+            ttl: Cache lifetime in seconds; defaults to the configured
+                marketaux_cache_ttl
+
+        Returns:
+            JSON response data as a dictionary
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails
+        """
+        if ttl is None:
+            ttl = self.config.marketaux_cache_ttl
+
+        key = (endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+
+        if ttl > 0:
+            cached = self._cache_get(key, now)
+            if cached is not None:
+                return cached
+
+        params["api_token"] = self.api_key
+        url = f"{self.base_url}{endpoint}"
+        # Same concurrency cap as the sync path; only the network call is
+        # limited so cache hits never wait
+        async with _get_arate_limit():
+            response = await self._get_aclient().get(url, params=params)
+        response.raise_for_status()
+        # orjson decodes the raw bytes directly, skipping both stdlib json
+        # and the intermediate text decode response.json() would do
+        data = orjson.loads(response.content)
+
+        if ttl > 0:
+            self._cache_put(key, data, now + ttl)
+
+        return data
+
+    @staticmethod
+    def _cache_get(key: tuple, now: float) -> Optional[Dict[str, Any]]:
+        """Look up a fresh cached response.
+
+        Args:
+            key: Cache key (endpoint, sorted params)
+            now: Current monotonic time
+
+        Returns:
+            Cached JSON data, or None on miss/expiry
+        """
+        with _cache_lock:
+            entry = _response_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        return None
+
+    @staticmethod
+    def _cache_put(key: tuple, data: Dict[str, Any], expires_at: float) -> None:
+        """Store a response in the cache, evicting FIFO when full.
+
+        Args:
+            key: Cache key (endpoint, sorted params)
+            data: Parsed JSON response to cache
+            expires_at: Monotonic expiry time
+        """
+        with _cache_lock:
+            while len(_response_cache) >= _CACHE_MAX_ENTRIES:
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[key] = (expires_at, data)
+
+    @staticmethod
+    def _news_params(
         symbols: str,
         sentiment_filter: Optional[str],
         language: str,
         limit: int,
         filter_entities: bool
-    ) -> str:
-        """Get financial news articles for specific stock symbols.
-        
+    ) -> Dict[str, Any]:
+        """Build the query parameters for a news request.
+
         Args:
             symbols: Comma-separated stock ticker symbols
             sentiment_filter: Filter by sentiment (positive/negative/neutral)
             language: Language code for articles
             limit: Number of articles to return
             filter_entities: Whether to filter entities in response
-            
+
         Returns:
-            Formatted news articles with sentiment analysis
+            Query parameter dict (without the api token)
         """
         params = {
             "symbols": symbols,
@@ -190,7 +521,7 @@ class MarketauxTool(BaseTool):
             "limit": limit,
             "filter_entities": str(filter_entities).lower()
         }
-        
+
         # Add sentiment filter if specified
         if sentiment_filter:
             if sentiment_filter == "positive":
@@ -200,68 +531,98 @@ class MarketauxTool(BaseTool):
             elif sentiment_filter == "neutral":
                 params["sentiment_gte"] = "0"
                 params["sentiment_lte"] = "0"
-        
+
+        return params
+
+    def _get_news(
+        self,
+        symbols: str,
+        sentiment_filter: Optional[str],
+        language: str,
+        limit: int,
+        filter_entities: bool
+    ) -> str:
+        """Get financial news articles for specific stock symbols.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols
+            sentiment_filter: Filter by sentiment (positive/negative/neutral)
+            language: Language code for articles
+            limit: Number of articles to return
+            filter_entities: Whether to filter entities in response
+
+        Returns:
+            Formatted news articles with sentiment analysis
+        """
+        params = self._news_params(symbols, sentiment_filter, language, limit, filter_entities)
         data = self._make_api_request("/news/all", params)
-        
+        return self._format_news(data, symbols)
+
+    def _format_news(self, data: Dict[str, Any], symbols: str) -> str:
+        """Format a news response into readable text.
+
+        Args:
+            data: JSON response from the news endpoint
+            symbols: Symbols the query was for (used in headers/messages)
+
+        Returns:
+            Formatted news articles with sentiment analysis
+        """
         if "error" in data:
             error_msg = data["error"].get("message", "Unknown error")
             return f"Error fetching news: {error_msg}"
-        
+
         if "data" not in data or not data["data"]:
             return f"No news articles found for symbols: {symbols}"
-        
+
         articles = data["data"]
         meta = data.get("meta", {})
-        
-        result = f"📰 Financial News for {symbols.upper()}\n"
-        result += f"Found {meta.get('found', len(articles))} articles (showing {len(articles)})\n"
-        result += "=" * 80 + "\n\n"
-        
+
+        # Accumulate parts and join once; += in the nested loops reallocates
+        # the growing buffer per append
+        parts = [
+            f"📰 Financial News for {symbols}\n",
+            f"Found {meta.get('found', len(articles))} articles (showing {len(articles)})\n",
+            "=" * 80 + "\n\n",
+        ]
+
         for i, article in enumerate(articles, 1):
-            result += f"{i}. {article.get('title', 'No title')}\n"
-            result += f"   📅 Published: {article.get('published_at', 'N/A')}\n"
-            result += f"   🔗 URL: {article.get('url', 'N/A')}\n"
-            result += f"   📰 Source: {article.get('source', 'N/A')}\n"
-            
+            parts.append(f"{i}. {article.get('title', 'No title')}\n")
+            parts.append(f"   📅 Published: {article.get('published_at', 'N/A')}\n")
+            parts.append(f"   🔗 URL: {article.get('url', 'N/A')}\n")
+            parts.append(f"   📰 Source: {article.get('source', 'N/A')}\n")
+
             # Add entity sentiment information
             entities = article.get('entities', [])
             if entities:
-                result += f"   📊 Entities mentioned:\n"
+                parts.append("   📊 Entities mentioned:\n")
                 for entity in entities[:3]:  # Show top 3 entities
                     symbol = entity.get('symbol', 'N/A')
                     name = entity.get('name', 'N/A')
                     sentiment = entity.get('sentiment_score', 0)
-                    
-                    # Format sentiment with emoji
-                    if sentiment > 0.1:
-                        sentiment_emoji = "📈 Positive"
-                    elif sentiment < -0.1:
-                        sentiment_emoji = "📉 Negative"
-                    else:
-                        sentiment_emoji = "➖ Neutral"
-                    
-                    result += f"      • {name} ({symbol}) - {sentiment_emoji} ({sentiment:.2f})\n"
-            
+
+                    parts.append(f"      • {name} ({symbol}) - {_sent_label(sentiment)} ({sentiment:.2f})\n")
+
             # Add snippet if available
             description = article.get('description', '')
             if description:
                 snippet = description[:150] + "..." if len(description) > 150 else description
-                result += f"   📝 {snippet}\n"
-            
-            result += "\n"
-        
-        return result
-    
+                parts.append(f"   📝 {snippet}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
+
     def _search_entity(self, keywords: str, limit: int) -> str:
         """Search for entities/companies by name or keywords.
-        
+
         Uses the news endpoint to find articles mentioning the keywords,
         then extracts entity information from those articles.
-        
+
         Args:
             keywords: Search keywords (company name, etc.)
             limit: Number of results to return
-            
+
         Returns:
             List of matching entities with their details
         """
@@ -271,18 +632,30 @@ class MarketauxTool(BaseTool):
             "limit": limit,
             "must_have_entities": "true"
         }
-        
-        data = self._make_api_request("/news/all", params)
-        
+
+        data = self._make_api_request("/news/all", params, ttl=_ENTITY_SEARCH_TTL)
+        return self._format_search(data, keywords, limit)
+
+    def _format_search(self, data: Dict[str, Any], keywords: str, limit: int) -> str:
+        """Format an entity-search response into readable text.
+
+        Args:
+            data: JSON response from the news endpoint
+            keywords: Search keywords the query was for
+            limit: Number of results to show
+
+        Returns:
+            List of matching entities with their details
+        """
         if "error" in data:
             error_msg = data["error"].get("message", "Unknown error")
             return f"Error searching entities: {error_msg}"
-        
+
         if "data" not in data or not data["data"]:
             return f"No entities found for keywords: {keywords}"
-        
+
         articles = data["data"]
-        
+
         # Extract unique entities from articles
         entity_dict = {}
         for article in articles:
@@ -291,36 +664,38 @@ class MarketauxTool(BaseTool):
                 symbol = entity.get('symbol')
                 if symbol and symbol not in entity_dict:
                     entity_dict[symbol] = entity
-        
+
         if not entity_dict:
             return f"No entities found for keywords: {keywords}"
-        
-        result = f"🔍 Entity Search Results for '{keywords}'\n"
-        result += f"Found {len(entity_dict)} unique entities in recent news\n"
-        result += "=" * 80 + "\n\n"
-        
+
+        parts = [
+            f"🔍 Entity Search Results for '{keywords}'\n",
+            f"Found {len(entity_dict)} unique entities in recent news\n",
+            "=" * 80 + "\n\n",
+        ]
+
         for i, (symbol, entity) in enumerate(list(entity_dict.items())[:limit], 1):
-            result += f"{i}. {entity.get('name', 'N/A')}\n"
-            result += f"   Symbol: {entity.get('symbol', 'N/A')}\n"
-            result += f"   Type: {entity.get('type', 'N/A')}\n"
-            result += f"   Industry: {entity.get('industry', 'N/A')}\n"
-            result += f"   Country: {entity.get('country', 'N/A')}\n"
-            
+            parts.append(f"{i}. {entity.get('name', 'N/A')}\n")
+            parts.append(f"   Symbol: {entity.get('symbol', 'N/A')}\n")
+            parts.append(f"   Type: {entity.get('type', 'N/A')}\n")
+            parts.append(f"   Industry: {entity.get('industry', 'N/A')}\n")
+            parts.append(f"   Country: {entity.get('country', 'N/A')}\n")
+
             if entity.get('exchange'):
-                result += f"   Exchange: {entity.get('exchange')}\n"
-            
-            result += "\n"
-        
-        return result
-    
+                parts.append(f"   Exchange: {entity.get('exchange')}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
+
     def _get_trending(self, limit: int) -> str:
         """Get currently trending entities in the market.
-        
+
         Analyzes recent news articles to identify most mentioned entities.
-        
+
         Args:
             limit: Number of trending entities to return
-            
+
         Returns:
             List of trending entities with mention counts
         """
@@ -330,186 +705,327 @@ class MarketauxTool(BaseTool):
             "must_have_entities": "true",
             "language": "en"
         }
-        
-        data = self._make_api_request("/news/all", params)
-        
+
+        data = self._make_api_request("/news/all", params, ttl=_TRENDING_TTL)
+        return self._format_trending(data, limit)
+
+    def _format_trending(self, data: Dict[str, Any], limit: int) -> str:
+        """Format recent-news data into a trending-entities report.
+
+        Args:
+            data: JSON response from the news endpoint
+            limit: Number of trending entities to show
+
+        Returns:
+            List of trending entities with mention counts
+        """
         if "error" in data:
             error_msg = data["error"].get("message", "Unknown error")
             return f"Error fetching trending entities: {error_msg}"
-        
+
         if "data" not in data or not data["data"]:
             return "No trending entities found at this time."
-        
+
         articles = data["data"]
-        
-        # Count entity mentions and calculate average sentiment
+        article_count = len(articles)
+
+        # Project down to the entity lists before aggregating: everything
+        # else in the article payload (descriptions, urls, keywords, ...)
+        # is dead weight for this query and can be dropped immediately
+        entity_lists = [a['entities'] for a in articles if a.get('entities')]
+        del articles
+
+        # Count entity mentions with a running sentiment sum/count instead
+        # of storing every score and re-walking the stats in a second pass
         entity_stats = {}
-        for article in articles:
-            entities = article.get('entities', [])
+        for entities in entity_lists:
             for entity in entities:
                 symbol = entity.get('symbol')
                 if not symbol:
                     continue
-                
-                if symbol not in entity_stats:
-                    entity_stats[symbol] = {
+
+                stats = entity_stats.get(symbol)
+                if stats is None:
+                    stats = entity_stats[symbol] = {
                         'name': entity.get('name', 'N/A'),
                         'symbol': symbol,
                         'type': entity.get('type', 'N/A'),
                         'industry': entity.get('industry', 'N/A'),
                         'mentions': 0,
-                        'sentiment_scores': []
+                        'sentiment_sum': 0.0,
+                        'sentiment_count': 0
                     }
-                
-                entity_stats[symbol]['mentions'] += 1
+
+                stats['mentions'] += 1
                 sentiment = entity.get('sentiment_score', 0)
                 if sentiment is not None:
-                    entity_stats[symbol]['sentiment_scores'].append(sentiment)
-        
-        # Calculate average sentiment and sort by mentions
-        trending_entities = []
-        for symbol, stats in entity_stats.items():
-            if stats['sentiment_scores']:
-                avg_sentiment = sum(stats['sentiment_scores']) / len(stats['sentiment_scores'])
-            else:
-                avg_sentiment = 0
-            
-            trending_entities.append({
-                'symbol': stats['symbol'],
-                'name': stats['name'],
-                'type': stats['type'],
-                'industry': stats['industry'],
-                'mentions': stats['mentions'],
-                'sentiment_avg': avg_sentiment
-            })
-        
-        # Sort by mentions (descending)
-        trending_entities.sort(key=lambda x: x['mentions'], reverse=True)
-        
-        # Limit results
-        trending_entities = trending_entities[:limit]
-        
+                    stats['sentiment_sum'] += sentiment
+                    stats['sentiment_count'] += 1
+
+        # Top N by mentions: O(S log limit) instead of sorting all entities;
+        # itemgetter keeps each comparison key a C-level call
+        trending_entities = heapq.nlargest(
+            limit, entity_stats.values(), key=operator.itemgetter('mentions')
+        )
+
         if not trending_entities:
             return "No trending entities found at this time."
-        
-        result = "🔥 Trending Entities in the Market\n"
-        result += f"Based on analysis of {len(articles)} recent articles\n"
-        result += "=" * 80 + "\n\n"
-        
+
+        parts = [
+            "🔥 Trending Entities in the Market\n",
+            f"Based on analysis of {article_count} recent articles\n",
+            "=" * 80 + "\n\n",
+        ]
+
         for i, entity in enumerate(trending_entities, 1):
             symbol = entity['symbol']
             name = entity['name']
             mentions = entity['mentions']
-            sentiment_avg = entity['sentiment_avg']
-            
-            # Format sentiment
-            if sentiment_avg > 0.1:
-                sentiment_emoji = "📈 Positive"
-            elif sentiment_avg < -0.1:
-                sentiment_emoji = "📉 Negative"
+
+            # Average computed only for the emitted top N
+            if entity['sentiment_count']:
+                sentiment_avg = entity['sentiment_sum'] / entity['sentiment_count']
             else:
-                sentiment_emoji = "➖ Neutral"
-            
-            result += f"{i}. {name} ({symbol})\n"
-            result += f"   💬 Mentions: {mentions}\n"
-            result += f"   📊 Avg Sentiment: {sentiment_emoji} ({sentiment_avg:.2f})\n"
-            
+                sentiment_avg = 0
+
+            parts.append(f"{i}. {name} ({symbol})\n")
+            parts.append(f"   💬 Mentions: {mentions}\n")
+            parts.append(f"   📊 Avg Sentiment: {_sent_label(sentiment_avg)} ({sentiment_avg:.2f})\n")
+
             if entity.get('industry') and entity['industry'] != 'N/A':
-                result += f"   🏢 Industry: {entity['industry']}\n"
-            
-            result += "\n"
-        
-        return result
-    
+                parts.append(f"   🏢 Industry: {entity['industry']}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
+
     def _get_performance(self, symbols: str, limit: int = 50) -> str:
         """Get market performance data for specific symbols.
-        
+
         Analyzes recent news mentions and sentiment for specified symbols.
-        
+
         Args:
             symbols: Comma-separated stock ticker symbols
             limit: Number of articles to analyze per symbol
-            
+
         Returns:
             Market performance statistics and sentiment analysis
         """
-        params = {
-            "symbols": symbols,
-            "limit": limit,  # Analyze more articles for better statistics
-            "filter_entities": "true"
-        }
-        
-        data = self._make_api_request("/news/all", params)
-        
-        if "error" in data:
-            error_msg = data["error"].get("message", "Unknown error")
-            return f"Error fetching performance data: {error_msg}"
-        
-        if "data" not in data or not data["data"]:
+        syms = [s.strip() for s in symbols.split(",") if s.strip()]
+
+        if len(syms) > 1:
+            # One request per ticker, fetched in parallel: per-symbol stats
+            # aren't biased toward whichever symbol dominates a mixed query,
+            # and wall time is the slowest response instead of the sum
+            articles = []
+            # An article co-mentioning several queried tickers comes back
+            # from each per-symbol request; dedupe on identity so its
+            # mentions aren't double-counted in the merged stats
+            seen = set()
+            with ThreadPoolExecutor(max_workers=min(8, len(syms))) as executor:
+                futures = [
+                    executor.submit(
+                        self._make_api_request,
+                        "/news/all",
+                        {"symbols": s, "limit": limit, "filter_entities": "true"}
+                    )
+                    for s in syms
+                ]
+                for future in as_completed(futures):
+                    data = future.result()
+                    if "error" not in data:
+                        for art in data.get("data") or []:
+                            key = hash(art.get("uuid") or art.get("url"))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            articles.append(art)
+        else:
+            params = {
+                "symbols": symbols,
+                "limit": limit,  # Analyze more articles for better statistics
+                "filter_entities": "true"
+            }
+
+            data = self._make_api_request("/news/all", params)
+
+            if "error" in data:
+                error_msg = data["error"].get("message", "Unknown error")
+                return f"Error fetching performance data: {error_msg}"
+
+            articles = data.get("data") or []
+
+        return self._format_performance(articles, symbols)
+
+    async def _aget_performance(self, symbols: str, limit: int = 50) -> str:
+        """Async variant of _get_performance.
+
+        Multi-symbol queries fan out as concurrent requests on the event
+        loop via asyncio.gather instead of executor threads.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols
+            limit: Number of articles to analyze per symbol
+
+        Returns:
+            Market performance statistics and sentiment analysis
+        """
+        syms = [s.strip() for s in symbols.split(",") if s.strip()]
+
+        if len(syms) > 1:
+            responses = await asyncio.gather(*(
+                self._amake_api_request(
+                    "/news/all",
+                    {"symbols": s, "limit": limit, "filter_entities": "true"}
+                )
+                for s in syms
+            ))
+            articles = []
+            # Same co-mention dedupe as the sync variant
+            seen = set()
+            for data in responses:
+                if "error" not in data:
+                    for art in data.get("data") or []:
+                        key = hash(art.get("uuid") or art.get("url"))
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        articles.append(art)
+        else:
+            params = {
+                "symbols": symbols,
+                "limit": limit,
+                "filter_entities": "true"
+            }
+
+            data = await self._amake_api_request("/news/all", params)
+
+            if "error" in data:
+                error_msg = data["error"].get("message", "Unknown error")
+                return f"Error fetching performance data: {error_msg}"
+
+            articles = data.get("data") or []
+
+        return self._format_performance(articles, symbols)
+
+    def _format_performance(self, articles: List[Dict[str, Any]], symbols: str) -> str:
+        """Format merged article data into per-symbol performance stats.
+
+        Args:
+            articles: Articles to aggregate (possibly merged across requests)
+            symbols: Symbols the query was for (used in headers/messages)
+
+        Returns:
+            Market performance statistics and sentiment analysis
+        """
+        if not articles:
             return f"No performance data found for symbols: {symbols}"
-        
-        articles = data["data"]
-        
-        # Analyze sentiment per symbol
+
+        article_count = len(articles)
+
+        # Only the entity lists feed the aggregation; drop the article
+        # bodies (descriptions, urls, keywords, ...) up front
+        entity_lists = [a['entities'] for a in articles if a.get('entities')]
+        del articles
+
+        # Articles about the requested tickers co-mention plenty of others;
+        # restricting to the requested set keeps both the loop and the
+        # report scoped to what the caller asked about
+        # symbols arrives canonicalized (upper-cased, whitespace-free) from
+        # the execute boundary
+        wanted = frozenset(filter(None, symbols.split(",")))
+
+        # Analyze sentiment per symbol with a running sum/count rather than
+        # keeping every score around for a second averaging pass
         symbol_stats = {}
-        for article in articles:
-            entities = article.get('entities', [])
+        for entities in entity_lists:
             for entity in entities:
                 symbol = entity.get('symbol')
-                if not symbol:
+                if not symbol or symbol.upper() not in wanted:
                     continue
-                
-                if symbol not in symbol_stats:
-                    symbol_stats[symbol] = {
+
+                stats = symbol_stats.get(symbol)
+                if stats is None:
+                    stats = symbol_stats[symbol] = {
                         'name': entity.get('name', 'N/A'),
                         'symbol': symbol,
                         'mentions': 0,
                         'positive': 0,
                         'negative': 0,
                         'neutral': 0,
-                        'sentiment_scores': []
+                        'sentiment_sum': 0.0,
+                        'sentiment_count': 0
                     }
-                
-                symbol_stats[symbol]['mentions'] += 1
+
+                stats['mentions'] += 1
                 sentiment = entity.get('sentiment_score', 0)
-                
+
                 if sentiment is not None:
-                    symbol_stats[symbol]['sentiment_scores'].append(sentiment)
-                    
-                    if sentiment > 0.1:
-                        symbol_stats[symbol]['positive'] += 1
-                    elif sentiment < -0.1:
-                        symbol_stats[symbol]['negative'] += 1
-                    else:
-                        symbol_stats[symbol]['neutral'] += 1
-        
+                    stats['sentiment_sum'] += sentiment
+                    stats['sentiment_count'] += 1
+                    stats[_SENT_KEYS[bisect.bisect_right(_SENT_BREAKS, sentiment)]] += 1
+
         if not symbol_stats:
             return f"No performance data found for symbols: {symbols}"
-        
-        result = f"📊 Market Performance for {symbols.upper()}\n"
-        result += f"Based on analysis of {len(articles)} recent articles\n"
-        result += "=" * 80 + "\n\n"
-        
+
+        parts = [
+            f"📊 Market Performance for {symbols}\n",
+            f"Based on analysis of {article_count} recent articles\n",
+            "=" * 80 + "\n\n",
+        ]
+
         for i, (symbol, stats) in enumerate(symbol_stats.items(), 1):
             name = stats['name']
             mentions = stats['mentions']
-            
+
             # Calculate average sentiment
-            if stats['sentiment_scores']:
-                sentiment_avg = sum(stats['sentiment_scores']) / len(stats['sentiment_scores'])
+            if stats['sentiment_count']:
+                sentiment_avg = stats['sentiment_sum'] / stats['sentiment_count']
             else:
                 sentiment_avg = 0
-            
-            result += f"{i}. {name} ({symbol})\n"
-            result += f"   📰 Total Mentions: {mentions}\n"
-            result += f"   📊 Avg Sentiment: {sentiment_avg:.2f}\n"
-            result += f"   📈 Positive Articles: {stats['positive']}\n"
-            result += f"   📉 Negative Articles: {stats['negative']}\n"
-            result += f"   ➖ Neutral Articles: {stats['neutral']}\n"
-            
-            result += "\n"
-        
-        return result
 
+            parts.append(f"{i}. {name} ({symbol})\n")
+            parts.append(f"   📰 Total Mentions: {mentions}\n")
+            parts.append(f"   📊 Avg Sentiment: {sentiment_avg:.2f}\n")
+            parts.append(f"   📈 Positive Articles: {stats['positive']}\n")
+            parts.append(f"   📉 Negative Articles: {stats['negative']}\n")
+            parts.append(f"   ➖ Neutral Articles: {stats['neutral']}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
+
+    # Per-query-type error text for a missing symbols argument; query types
+    # absent here don't require symbols
+    _SYMBOLS_ERRORS = {
+        "news": "Error: 'symbols' parameter is required for news queries. Please provide stock ticker symbols (e.g., 'AAPL,MSFT').",
+        "entity_search": "Error: 'symbols' parameter is required for entity search. Use it as search keywords (e.g., 'Apple', 'Microsoft').",
+        "performance": "Error: 'symbols' parameter is required for performance queries. Please provide stock ticker symbols.",
+    }
 
+    # query_type -> handler adapting the uniform execute() argument set to
+    # each fetcher's signature; built once at class creation so dispatch is
+    # a single dict lookup instead of an if/elif chain per call
+    _DISPATCH = {
+        "news": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._get_news(symbols, sentiment_filter, language, limit, filter_entities),
+        "entity_search": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._search_entity(symbols, limit),
+        "trending": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._get_trending(limit),
+        "performance": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._get_performance(symbols, limit),
+    }
 
+    # Async counterpart used by aexecute; adapters return coroutines that
+    # the caller awaits
+    _ADISPATCH = {
+        "news": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._aget_news(symbols, sentiment_filter, language, limit, filter_entities),
+        "entity_search": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._asearch_entity(symbols, limit),
+        "trending": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._aget_trending(limit),
+        "performance": lambda self, symbols, sentiment_filter, language, limit, filter_entities:
+            self._aget_performance(symbols, limit),
+    }
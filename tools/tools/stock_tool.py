@@ -1,11 +1,162 @@
 """Stock market data tool using Alpha Vantage API."""
 
+import asyncio
+import heapq
+import re
+import ssl
+import threading
+import time
+import weakref
+from collections import deque
+
 from pydantic import BaseModel, Field
-from typing import Type, Literal, Dict, Any
+from typing import Type, Literal, Dict, Any, Optional
 from requests import Response
+from requests.adapters import HTTPAdapter, Retry
+import httpx
+import orjson
 import requests
 from intelligentAgent.tools.base import BaseTool
-from intelligentAgent.config import AgentConfig
+from intelligentAgent.config import AgentConfig, get_config
+
+
+# (connect, read) timeout so a stalled API call can't hang the agent loop
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Advertise brotli only when a decoder is importable; requesting br without
+# one would leave the body undecoded. Falls back to gzip/deflate otherwise.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+# One process-wide SSLContext: urllib3 normally builds a fresh context per
+# pool, discarding the TLS session cache with it. Sharing the context lets
+# TLS 1.3 session tickets resume abbreviated handshakes even after a pooled
+# connection is evicted, saving ~1 RTT per reconnect.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.post_handshake_auth = False
+
+
+class _TLSAdapter(HTTPAdapter):
+    """HTTPAdapter that threads a shared SSLContext into its pools.
+
+    Args:
+        ssl_context: Context reused by every connection the adapter opens
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(connections, maxsize, block=block, **kwargs)
+
+# Process-wide TTL response cache shared by sync and async paths: Alpha
+# Vantage's free tier caps out at 5 req/min, so repeated identical queries
+# within a function's freshness window answer from memory instead of
+# spending quota. Insertion-ordered dict with FIFO eviction, same scheme
+# as the Marketaux tool's cache. key -> (expires_at, parsed response)
+_CACHE_MAX_ENTRIES = 512
+_response_cache: Dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+
+# Alpha Vantage free-tier budget: waiting out the window locally is
+# cheaper than burning a round-trip on a 'Note' throttle reply and
+# polluting a retry cycle. Timestamps of reserved send slots, oldest
+# first; _rate_delay reserves a slot and says how long to wait for it.
+_RATE_LIMIT_CALLS = 5
+_RATE_LIMIT_WINDOW = 60.0
+_rate_slots: deque = deque()
+_rate_lock = threading.Lock()
+
+
+def _rate_delay() -> float:
+    """Reserve a request slot under the free-tier rate limit.
+
+    Returns:
+        Seconds the caller should sleep before sending (0 when a slot
+        is free now)
+    """
+    with _rate_lock:
+        now = time.monotonic()
+        while _rate_slots and _rate_slots[0] <= now - _RATE_LIMIT_WINDOW:
+            _rate_slots.popleft()
+        if len(_rate_slots) < _RATE_LIMIT_CALLS:
+            _rate_slots.append(now)
+            return 0.0
+        # Window full: claim the moment the slot N-back from this one
+        # expires, so reservations stay 5-per-window apart
+        send_at = _rate_slots[-_RATE_LIMIT_CALLS] + _RATE_LIMIT_WINDOW
+        _rate_slots.append(send_at)
+        return send_at - now
+
+
+# One or more comma-separated tickers (letters/digits with optional
+# class/exchange suffixes like BRK.B or RDS-A); malformed symbols are
+# rejected locally instead of wasting a round-trip and a quota unit on
+# a guaranteed-empty server reply
+_SYMBOLS_RE = re.compile(r"[A-Z0-9.\-]{1,10}(?:,[A-Z0-9.\-]{1,10})*")
+
+# Quote report template and the response keys that fill it, hoisted so
+# each render is one .format call over pre-built literals
+_QUOTE_TEMPLATE = (
+    "Stock Quote for {}:\n"
+    "• Price: ${}\n"
+    "• Change: {} ({})\n"
+    "• Open: ${}\n"
+    "• High: ${}\n"
+    "• Low: ${}\n"
+    "• Volume: {}\n"
+    "• Previous Close: ${}\n"
+    "• Latest Trading Day: {}"
+)
+_QUOTE_KEYS = (
+    "05. price",
+    "09. change",
+    "10. change percent",
+    "02. open",
+    "03. high",
+    "04. low",
+    "06. volume",
+    "08. previous close",
+    "07. latest trading day",
+)
+
+# (label, response key, value prefix) triples driving the overview report
+_OVERVIEW_FIELDS = (
+    ("Name", "Name", ""),
+    ("Sector", "Sector", ""),
+    ("Industry", "Industry", ""),
+    ("Market Cap", "MarketCapitalization", "$"),
+    ("P/E Ratio", "PERatio", ""),
+    ("EPS", "EPS", ""),
+    ("52 Week High", "52WeekHigh", "$"),
+    ("52 Week Low", "52WeekLow", "$"),
+    ("50 Day MA", "50DayMovingAverage", "$"),
+    ("200 Day MA", "200DayMovingAverage", "$"),
+    ("Dividend Yield", "DividendYield", ""),
+    ("Exchange", "Exchange", ""),
+    ("Country", "Country", ""),
+)
+_OVERVIEW_INDENT = "                    "
+
+# Per-function TTLs matched to how often the upstream data changes:
+# quotes move intraday, daily series roll once per trading day, company
+# overviews and symbol search results are effectively static
+_FUNCTION_TTLS = {
+    "GLOBAL_QUOTE": 60,
+    "REALTIME_BULK_QUOTES": 60,
+    "TIME_SERIES_DAILY": 3600,
+    "OVERVIEW": 86400,
+    "SYMBOL_SEARCH": 86400,
+}
 
 
 class StockInput(BaseModel):
@@ -13,12 +164,12 @@ class StockInput(BaseModel):
     
     symbol: str = Field(
         ...,
-        description="Stock ticker symbol (e.g., 'IBM', 'AAPL', 'GOOGL')"
+        description="Stock ticker symbol (e.g., 'IBM', 'AAPL', 'GOOGL'). For 'bulk_quote', a comma-separated list (e.g., 'AAPL,MSFT,GOOGL')"
     )
-    
-    query_type: Literal["quote", "overview", "daily", "search"] = Field(
+
+    query_type: Literal["quote", "overview", "daily", "search", "bulk_quote"] = Field(
         default="quote",
-        description="Type of data to fetch: 'quote' (real-time price), 'overview' (company info), 'daily' (price history), 'search' (find ticker symbols)"
+        description="Type of data to fetch: 'quote' (real-time price), 'bulk_quote' (real-time prices for several symbols in one call), 'overview' (company info), 'daily' (price history), 'search' (find ticker symbols)"
     )
     
     outputsize: Literal["compact"] = Field(
@@ -36,7 +187,8 @@ class StockTool(BaseTool):
     name: str = "get_stock_data"
     description: str = (
         "Get stock market data including real-time quotes, company information, "
-        "and historical prices. Use 'quote' for current price, 'overview' for company details, "
+        "and historical prices. Use 'quote' for current price, 'bulk_quote' for "
+        "current prices of several symbols at once, 'overview' for company details, "
         "'daily' for price history, or 'search' to find ticker symbols."
     )
     args_schema: Type[BaseModel] = StockInput
@@ -45,10 +197,77 @@ class StockTool(BaseTool):
     def __init__(self):
         """Initialize the stock tool with API configuration."""
         super().__init__()
-        self.config: AgentConfig = AgentConfig()
+        self.config: AgentConfig = get_config()
         self.api_key: str = self.config.alphavantage_api_key
         self.base_url: str = self.BASE_URL
-    
+
+        # Pooled session: keepalive reuses the TCP+TLS connection to the
+        # API host across query types instead of re-handshaking per call,
+        # and throttling/gateway errors get a short retry with backoff
+        self._session = requests.Session()
+        self._session.mount("https://", _TLSAdapter(
+            ssl_context=_SSL_CONTEXT,
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+        # Explicit negotiation: some proxies strip the default header and
+        # TIME_SERIES_DAILY payloads are ~5-10x smaller compressed
+        self._session.headers.update({
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "User-Agent": "intelligentAgent/0.1",
+        })
+
+        # Async clients for aexecute, created lazily per event loop: a
+        # client's keepalive connections are bound to the loop that opened
+        # them, so a single cached client breaks on the next query's loop
+        self._aclients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        # Per-endpoint base params with the apikey baked in: call sites
+        # spread these and add only the symbol/keywords, skipping the
+        # repeated literal-key dict builds on every request
+        self._p_quote = {"function": "GLOBAL_QUOTE", "apikey": self.api_key}
+        self._p_bulk = {"function": "REALTIME_BULK_QUOTES", "apikey": self.api_key}
+        self._p_overview = {"function": "OVERVIEW", "apikey": self.api_key}
+        self._p_daily = {"function": "TIME_SERIES_DAILY", "apikey": self.api_key}
+        self._p_search = {"function": "SYMBOL_SEARCH", "apikey": self.api_key}
+
+        # Single-flight maps: identical queries already on the wire are
+        # awaited rather than re-fetched (threads wait on an Event, async
+        # callers await the leader's Future)
+        self._inflight: Dict[tuple, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight: Dict[tuple, "asyncio.Future"] = {}
+
+    def __del__(self):
+        """Close the pooled session when the tool is collected."""
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Get (or lazily create) the pooled async client for the running loop.
+
+        Returns:
+            httpx.AsyncClient with keepalive pooling, HTTP/2 if available
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            limits = httpx.Limits(max_connections=10)
+            try:
+                client = httpx.AsyncClient(http2=True, limits=limits, timeout=10)
+            except ImportError:
+                # h2 extra not installed - HTTP/1.1 with keepalive still pools
+                client = httpx.AsyncClient(limits=limits, timeout=10)
+            self._aclients[loop] = client
+        return client
+
     def execute(self, symbol: str, query_type: str = "quote", outputsize: str = "compact") -> str:
         """Fetch stock market data from Alpha Vantage.
         
@@ -57,6 +276,8 @@ class StockTool(BaseTool):
             query_type: Type of data to fetch. Options:
                 - 'quote': Real-time stock quote with current price, change, volume,
                           open/high/low, and previous close
+                - 'bulk_quote': Real-time quotes for up to 100 comma-separated
+                               symbols in a single API call
                 - 'overview': Company fundamental data including name, sector, industry,
                              market cap, P/E ratio, EPS, moving averages, and description
                 - 'daily': Historical daily price data (OHLCV) for the last 5 trading days
@@ -70,21 +291,52 @@ class StockTool(BaseTool):
         Returns:
             Formatted string with stock data appropriate to the query type
         """
+        handler = self._DISPATCH.get(query_type)
+        if handler is None:
+            return f"Error: Unknown query_type '{query_type}'"
+
+        if query_type != "search":
+            # Canonicalize and reject malformed tickers locally; search
+            # takes free-form keywords and is exempt
+            symbol = symbol.replace(" ", "").upper()
+            if not _SYMBOLS_RE.fullmatch(symbol):
+                return f"Error: Invalid ticker symbol '{symbol}'. Please verify the ticker symbol."
+
         try:
-            if query_type == "quote":
-                return self._get_quote(symbol)
-            elif query_type == "overview":
-                return self._get_overview(symbol)
-            elif query_type == "daily":
-                return self._get_daily(symbol, outputsize)
-            elif query_type == "search":
-                return self._search_symbol(symbol)
-            else:
-                return f"Error: Unknown query_type '{query_type}'"
-                
+            return handler(self, symbol, outputsize)
         except Exception as e:
             return f"Error fetching stock data: {str(e)}"
-    
+
+    async def aexecute(self, symbol: str, query_type: str = "quote", outputsize: str = "compact") -> str:
+        """Async variant of execute for use inside an event loop.
+
+        Fetches go through a pooled httpx.AsyncClient, so concurrent tool
+        calls overlap on the event loop instead of serializing or occupying
+        executor threads. Formatting is shared with the sync path.
+
+        Args:
+            symbol: Stock ticker symbol; see execute
+            query_type: Type of data to fetch; see execute
+            outputsize: Size of data return for 'daily' queries; see execute
+
+        Returns:
+            Formatted string with stock data appropriate to the query type
+        """
+        handler = self._ADISPATCH.get(query_type)
+        if handler is None:
+            return f"Error: Unknown query_type '{query_type}'"
+
+        if query_type != "search":
+            # Same canonicalization and local validation as execute
+            symbol = symbol.replace(" ", "").upper()
+            if not _SYMBOLS_RE.fullmatch(symbol):
+                return f"Error: Invalid ticker symbol '{symbol}'. Please verify the ticker symbol."
+
+        try:
+            return await handler(self, symbol, outputsize)
+        except Exception as e:
+            return f"Error fetching stock data: {str(e)}"
+
     def _make_api_request(self, params: Dict[str, str]) -> Dict[str, Any]:
         """Make an API request to Alpha Vantage and return JSON data.
         
@@ -97,29 +349,238 @@ class StockTool(BaseTool):
         Raises:
             requests.HTTPError: If the HTTP request fails
         """
-        response: Response = requests.get(self.base_url, params=params)
+        key = self._cache_key(params)
+        cached = self._cache_get(key, time.monotonic())
+        if cached is not None:
+            return cached
+
+        # Single-flight: if an identical request is already on the wire
+        # from another thread, wait for it and serve its cached result
+        # instead of spending a second network call and quota unit
+        with self._inflight_lock:
+            waiter = self._inflight.get(key)
+            if waiter is None:
+                self._inflight[key] = threading.Event()
+
+        if waiter is not None:
+            # The leader's finally always sets the event, so no timeout
+            waiter.wait()
+            cached = self._cache_get(key, time.monotonic())
+            if cached is not None:
+                return cached
+            # Leader failed or its response wasn't cacheable; fetch directly
+            return self._fetch(key, params)
+
+        try:
+            return self._fetch(key, params)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key).set()
+
+    def _fetch(self, key: tuple, params: Dict[str, str]) -> Dict[str, Any]:
+        """Perform the HTTP GET and cache the parsed response.
+
+        Args:
+            key: Cache key for the query
+            params: Dictionary of query parameters for the API request
+
+        Returns:
+            JSON response data as a dictionary
+
+        Raises:
+            requests.HTTPError: If the HTTP request fails
+        """
+        delay = _rate_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        now = time.monotonic()
+        response: Response = self._session.get(self.base_url, params=params, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
-    
+        # orjson decodes the raw bytes directly, skipping both stdlib json
+        # and the intermediate text decode response.json() would do
+        data = orjson.loads(response.content)
+
+        self._cache_store(key, params, data, now)
+        return data
+
+    async def _amake_api_request(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Async variant of _make_api_request via the pooled httpx client.
+
+        Shares the TTL response cache with the sync path and deduplicates
+        concurrent identical requests within the event loop: later callers
+        await the first caller's pending Future rather than re-fetching.
+
+        Args:
+            params: Dictionary of query parameters for the API request
+
+        Returns:
+            JSON response data as a dictionary
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails
+        """
+        key = self._cache_key(params)
+        cached = self._cache_get(key, time.monotonic())
+        if cached is not None:
+            return cached
+
+        pending = self._ainflight.get(key)
+        if pending is not None:
+            # shield so one cancelled waiter can't cancel the shared fetch
+            return await asyncio.shield(pending)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._ainflight[key] = fut
+        try:
+            data = await self._afetch(key, params)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved in case there are no waiters
+            raise
+        else:
+            fut.set_result(data)
+            return data
+        finally:
+            del self._ainflight[key]
+
+    async def _afetch(self, key: tuple, params: Dict[str, str]) -> Dict[str, Any]:
+        """Async variant of _fetch via the pooled httpx client.
+
+        Args:
+            key: Cache key for the query
+            params: Dictionary of query parameters for the API request
+
+        Returns:
+            JSON response data as a dictionary
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails
+        """
+        delay = _rate_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        now = time.monotonic()
+        client = self._get_aclient()
+        response = await client.get(self.base_url, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        self._cache_store(key, params, data, now)
+        return data
+
+    @staticmethod
+    def _extract_error(data: Dict[str, Any]) -> str:
+        """Pull the most specific error message out of an API response.
+
+        One ordered scan instead of nested .get chains at every call
+        site; 'Information' covers the rate-limit key newer Alpha
+        Vantage responses use.
+
+        Args:
+            data: Parsed API response
+
+        Returns:
+            Error text reported by the API, or 'Unknown error'
+        """
+        for k in ("Note", "Error Message", "Information"):
+            v = data.get(k)
+            if v:
+                return v
+        return "Unknown error"
+
+    @staticmethod
+    def _cache_key(params: Dict[str, str]) -> tuple:
+        """Build a cache key from query params, excluding the API key.
+
+        Args:
+            params: Query parameters for the API request
+
+        Returns:
+            Hashable key identifying the query
+        """
+        return tuple(sorted((k, v) for k, v in params.items() if k != "apikey"))
+
+    @staticmethod
+    def _cache_get(key: tuple, now: float) -> Optional[Dict[str, Any]]:
+        """Look up a fresh cached response.
+
+        Args:
+            key: Cache key (sorted params sans apikey)
+            now: Current monotonic time
+
+        Returns:
+            Cached JSON data, or None on miss/expiry
+        """
+        with _cache_lock:
+            entry = _response_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        return None
+
+    @staticmethod
+    def _cache_store(key: tuple, params: Dict[str, str], data: Dict[str, Any], now: float) -> None:
+        """Cache a response for its function's TTL, evicting FIFO when full.
+
+        Rate-limit notices ('Note' responses) are never cached so a
+        throttled reply doesn't mask real data for a whole TTL window.
+
+        Args:
+            key: Cache key (sorted params sans apikey)
+            params: Query parameters the response was fetched with
+            data: Parsed JSON response
+            now: Monotonic time the fetch started
+        """
+        ttl = _FUNCTION_TTLS.get(params.get("function"))
+        if ttl is None or "Note" in data:
+            return
+        with _cache_lock:
+            while len(_response_cache) >= _CACHE_MAX_ENTRIES:
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[key] = (now + ttl, data)
+
     def _get_quote(self, symbol: str) -> str:
         """Get real-time quote data for a stock.
-        
+
         Args:
             symbol: Stock ticker symbol
-            
+
         Returns:
             Formatted quote information
         """
-        params = {
-            "function": "GLOBAL_QUOTE",
-            "symbol": symbol,
-            "apikey": self.api_key
-        }
-        
+        params = {**self._p_quote, "symbol": symbol}
+
         data = self._make_api_request(params)
-        
+        return self._format_quote(data, symbol)
+
+    async def _aget_quote(self, symbol: str) -> str:
+        """Async variant of _get_quote.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Formatted quote information
+        """
+        params = {**self._p_quote, "symbol": symbol}
+
+        data = await self._amake_api_request(params)
+        return self._format_quote(data, symbol)
+
+    @staticmethod
+    def _format_quote(data: Dict[str, Any], symbol: str) -> str:
+        """Format a GLOBAL_QUOTE response; shared by sync and async paths.
+
+        Args:
+            data: Parsed API response
+            symbol: Stock ticker symbol (for headers/errors)
+
+        Returns:
+            Formatted quote information
+        """
         if "Global Quote" not in data:
-            return f"Error: Could not fetch quote for '{symbol}'. {data.get('Note', data.get('Error Message', 'Unknown error'))}"
+            return f"Error: Could not fetch quote for '{symbol}'. {StockTool._extract_error(data)}"
         
         quote = data["Global Quote"]
         
@@ -127,20 +588,79 @@ class StockTool(BaseTool):
             return f"Error: No data found for symbol '{symbol}'. Please verify the ticker symbol."
         
         # Format the response
-        result: str = (
-            f"Stock Quote for {symbol}:\n"
-            f"• Price: ${quote.get('05. price', 'N/A')}\n"
-            f"• Change: {quote.get('09. change', 'N/A')} ({quote.get('10. change percent', 'N/A')})\n"
-            f"• Open: ${quote.get('02. open', 'N/A')}\n"
-            f"• High: ${quote.get('03. high', 'N/A')}\n"
-            f"• Low: ${quote.get('04. low', 'N/A')}\n"
-            f"• Volume: {quote.get('06. volume', 'N/A')}\n"
-            f"• Previous Close: ${quote.get('08. previous close', 'N/A')}\n"
-            f"• Latest Trading Day: {quote.get('07. latest trading day', 'N/A')}"
+        return _QUOTE_TEMPLATE.format(
+            symbol, *(quote.get(k, 'N/A') for k in _QUOTE_KEYS)
         )
-        
-        return result
-    
+
+    def _get_bulk_quotes(self, symbols: str) -> str:
+        """Get real-time quotes for several symbols in one API call.
+
+        One REALTIME_BULK_QUOTES round-trip replaces N GLOBAL_QUOTE
+        round-trips, amortizing the HTTPS exchange and quota cost over
+        every symbol in the batch.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols (up to 100)
+
+        Returns:
+            Formatted quote summary for each symbol
+        """
+        params = self._bulk_params(symbols)
+        data = self._make_api_request(params)
+        return self._format_bulk_quotes(data, symbols)
+
+    async def _aget_bulk_quotes(self, symbols: str) -> str:
+        """Async variant of _get_bulk_quotes.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols (up to 100)
+
+        Returns:
+            Formatted quote summary for each symbol
+        """
+        params = self._bulk_params(symbols)
+        data = await self._amake_api_request(params)
+        return self._format_bulk_quotes(data, symbols)
+
+    def _bulk_params(self, symbols: str) -> Dict[str, str]:
+        """Build REALTIME_BULK_QUOTES params, capped at the API's 100-symbol limit.
+
+        Args:
+            symbols: Comma-separated stock ticker symbols
+
+        Returns:
+            Query parameters for the bulk quote request
+        """
+        symbol_list = [s for s in symbols.split(",") if s][:100]
+        return {**self._p_bulk, "symbol": ",".join(symbol_list)}
+
+    @staticmethod
+    def _format_bulk_quotes(data: Dict[str, Any], symbols: str) -> str:
+        """Format a REALTIME_BULK_QUOTES response; shared by sync and async paths.
+
+        Args:
+            data: Parsed API response
+            symbols: Comma-separated symbols requested (for headers/errors)
+
+        Returns:
+            Formatted quote summary for each symbol
+        """
+        quotes = data.get("data")
+        if not quotes:
+            return f"Error: Could not fetch bulk quotes for '{symbols}'. {StockTool._extract_error(data)}"
+
+        parts = [f"Stock Quotes for {symbols}:\n"]
+        for quote in quotes:
+            parts.append(
+                f"\n{quote.get('symbol', 'N/A')}:\n"
+                f"• Price: ${quote.get('close', 'N/A')}\n"
+                f"• Change: {quote.get('change', 'N/A')} ({quote.get('change_percent', 'N/A')}%)\n"
+                f"• Volume: {quote.get('volume', 'N/A')}\n"
+                f"• Last Updated: {quote.get('timestamp', 'N/A')}\n"
+            )
+
+        return "".join(parts)
+
     def _get_overview(self, symbol: str) -> str:
         """Get company overview and fundamental data.
         
@@ -150,40 +670,52 @@ class StockTool(BaseTool):
         Returns:
             Formatted company information
         """
-        params = {
-            "function": "OVERVIEW",
-            "symbol": symbol,
-            "apikey": self.api_key
-        }
-        
+        params = {**self._p_overview, "symbol": symbol}
+
         data = self._make_api_request(params)
-        
+        return self._format_overview(data, symbol)
+
+    async def _aget_overview(self, symbol: str) -> str:
+        """Async variant of _get_overview.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Formatted company information
+        """
+        params = {**self._p_overview, "symbol": symbol}
+
+        data = await self._amake_api_request(params)
+        return self._format_overview(data, symbol)
+
+    @staticmethod
+    def _format_overview(data: Dict[str, Any], symbol: str) -> str:
+        """Format an OVERVIEW response; shared by sync and async paths.
+
+        Args:
+            data: Parsed API response
+            symbol: Stock ticker symbol (for headers/errors)
+
+        Returns:
+            Formatted company information
+        """
         if not data or "Symbol" not in data:
-            return f"Error: Could not fetch overview for '{symbol}'. {data.get('Note', data.get('Error Message', 'Unknown error'))}"
+            return f"Error: Could not fetch overview for '{symbol}'. {StockTool._extract_error(data)}"
         
         # Format the response with key information
         description: str = data.get('Description', 'N/A')
         if len(description) > 200:
             description = description[:200] + "..."
-        
-        result: str = f"""Company Overview for {symbol}:
-                    • Name: {data.get('Name', 'N/A')}
-                    • Sector: {data.get('Sector', 'N/A')}
-                    • Industry: {data.get('Industry', 'N/A')}
-                    • Market Cap: ${data.get('MarketCapitalization', 'N/A')}
-                    • P/E Ratio: {data.get('PERatio', 'N/A')}
-                    • EPS: {data.get('EPS', 'N/A')}
-                    • 52 Week High: ${data.get('52WeekHigh', 'N/A')}
-                    • 52 Week Low: ${data.get('52WeekLow', 'N/A')}
-                    • 50 Day MA: ${data.get('50DayMovingAverage', 'N/A')}
-                    • 200 Day MA: ${data.get('200DayMovingAverage', 'N/A')}
-                    • Dividend Yield: {data.get('DividendYield', 'N/A')}
-                    • Exchange: {data.get('Exchange', 'N/A')}
-                    • Country: {data.get('Country', 'N/A')}
-                    • Description: {description}
-                    """
-        
-        return result
+
+        parts = [f"Company Overview for {symbol}:\n"]
+        parts.extend(
+            f"{_OVERVIEW_INDENT}• {label}: {prefix}{data.get(key, 'N/A')}\n"
+            for label, key, prefix in _OVERVIEW_FIELDS
+        )
+        parts.append(f"{_OVERVIEW_INDENT}• Description: {description}\n{_OVERVIEW_INDENT}")
+
+        return "".join(parts)
     
     def _get_daily(self, symbol: str, outputsize: str) -> str:
         """Get daily time series price data.
@@ -195,45 +727,70 @@ class StockTool(BaseTool):
         Returns:
             Formatted daily price data
         """
-        params = {
-            "function": "TIME_SERIES_DAILY",
-            "symbol": symbol,
-            "outputsize": outputsize,
-            "apikey": self.api_key
-        }
-        
+        params = {**self._p_daily, "symbol": symbol, "outputsize": outputsize}
+
         data = self._make_api_request(params)
-        
+        return self._format_daily(data, symbol)
+
+    async def _aget_daily(self, symbol: str, outputsize: str) -> str:
+        """Async variant of _get_daily.
+
+        Args:
+            symbol: Stock ticker symbol
+            outputsize: 'compact' for last 100 days, 'full' for complete history
+
+        Returns:
+            Formatted daily price data
+        """
+        params = {**self._p_daily, "symbol": symbol, "outputsize": outputsize}
+
+        data = await self._amake_api_request(params)
+        return self._format_daily(data, symbol)
+
+    @staticmethod
+    def _format_daily(data: Dict[str, Any], symbol: str) -> str:
+        """Format a TIME_SERIES_DAILY response; shared by sync and async paths.
+
+        Args:
+            data: Parsed API response
+            symbol: Stock ticker symbol (for headers/errors)
+
+        Returns:
+            Formatted daily price data
+        """
         if "Time Series (Daily)" not in data:
-            return f"Error: Could not fetch daily data for '{symbol}'. {data.get('Note', data.get('Error Message', 'Unknown error'))}"
+            return f"Error: Could not fetch daily data for '{symbol}'. {StockTool._extract_error(data)}"
         
         time_series: Dict[str, Dict[str, str]] = data["Time Series (Daily)"]
         meta_data: Dict[str, str] = data.get("Meta Data", {})
         
-        # Get the most recent 5 days
-        recent_dates = sorted(time_series.keys(), reverse=True)[:5]
+        # Top-5 selection instead of fully sorting 100+ date keys;
+        # ISO dates order lexicographically so no parsing is needed
+        recent_dates = heapq.nlargest(5, time_series)
         
-        result = f"""Daily Price Data for {symbol}:
+        # Accumulate parts and join once; += in the loop reallocates the
+        # growing buffer per append
+        parts = [f"""Daily Price Data for {symbol}:
                 Last Refreshed: {meta_data.get('3. Last Refreshed', 'N/A')}
                 Timezone: {meta_data.get('5. Time Zone', 'N/A')}
 
                 Recent Trading Days (last 5):
-                """
-        
+                """]
+
         for date in recent_dates:
             day_data = time_series[date]
-            result += f"""
+            parts.append(f"""
                     {date}:
                     Open: ${day_data.get('1. open', 'N/A')}
                     High: ${day_data.get('2. high', 'N/A')}
                     Low: ${day_data.get('3. low', 'N/A')}
                     Close: ${day_data.get('4. close', 'N/A')}
                     Volume: {day_data.get('5. volume', 'N/A')}
-                    """
-        
-        result += f"\nTotal data points available: {len(time_series)}"
-        
-        return result
+                    """)
+
+        parts.append(f"\nTotal data points available: {len(time_series)}")
+
+        return "".join(parts)
     
     def _search_symbol(self, keywords: str) -> str:
         """Search for stock symbols by company name or keywords.
@@ -244,32 +801,73 @@ class StockTool(BaseTool):
         Returns:
             List of matching stock symbols
         """
-        params = {
-            "function": "SYMBOL_SEARCH",
-            "keywords": keywords,
-            "apikey": self.api_key
-        }
-        
+        params = {**self._p_search, "keywords": keywords}
+
         data = self._make_api_request(params)
-        
+        return self._format_search(data, keywords)
+
+    async def _asearch_symbol(self, keywords: str) -> str:
+        """Async variant of _search_symbol.
+
+        Args:
+            keywords: Search keywords (company name, etc.)
+
+        Returns:
+            List of matching stock symbols
+        """
+        params = {**self._p_search, "keywords": keywords}
+
+        data = await self._amake_api_request(params)
+        return self._format_search(data, keywords)
+
+    @staticmethod
+    def _format_search(data: Dict[str, Any], keywords: str) -> str:
+        """Format a SYMBOL_SEARCH response; shared by sync and async paths.
+
+        Args:
+            data: Parsed API response
+            keywords: Search keywords (for headers/errors)
+
+        Returns:
+            List of matching stock symbols
+        """
         if "bestMatches" not in data:
-            return f"Error: Could not search for '{keywords}'. {data.get('Note', data.get('Error Message', 'Unknown error'))}"
+            return f"Error: Could not search for '{keywords}'. {StockTool._extract_error(data)}"
         
         matches = data["bestMatches"]
         
         if not matches:
             return f"No matches found for '{keywords}'"
         
-        result = f"Search results for '{keywords}':\n\n"
-        
+        # Same buffer-and-join scheme as _format_daily
+        parts = [f"Search results for '{keywords}':\n\n"]
+
         for i, match in enumerate(matches[:10], 1):  # Show top 10 matches
-            result += f"""{i}. {match.get('2. name', 'N/A')}
+            parts.append(f"""{i}. {match.get('2. name', 'N/A')}
                         Symbol: {match.get('1. symbol', 'N/A')}
                         Type: {match.get('3. type', 'N/A')}
                         Region: {match.get('4. region', 'N/A')}
                         Match Score: {match.get('9. matchScore', 'N/A')}
 
-                        """
-        
-        return result
+                        """)
+
+        return "".join(parts)
+
+    # query_type -> handler dispatch, built once at class creation; the
+    # lambdas give every handler a uniform (symbol, outputsize) signature
+    _DISPATCH = {
+        "quote": lambda self, symbol, outputsize: self._get_quote(symbol),
+        "bulk_quote": lambda self, symbol, outputsize: self._get_bulk_quotes(symbol),
+        "overview": lambda self, symbol, outputsize: self._get_overview(symbol),
+        "daily": lambda self, symbol, outputsize: self._get_daily(symbol, outputsize),
+        "search": lambda self, symbol, outputsize: self._search_symbol(symbol),
+    }
+
+    _ADISPATCH = {
+        "quote": lambda self, symbol, outputsize: self._aget_quote(symbol),
+        "bulk_quote": lambda self, symbol, outputsize: self._aget_bulk_quotes(symbol),
+        "overview": lambda self, symbol, outputsize: self._aget_overview(symbol),
+        "daily": lambda self, symbol, outputsize: self._aget_daily(symbol, outputsize),
+        "search": lambda self, symbol, outputsize: self._asearch_symbol(symbol),
+    }
 